@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Persistent Aider worker for the benchmark runner.
+
+Keeps one Python process (and Aider's model/tokenizer setup) alive across
+benchmark runs instead of launching the `aider` CLI per task. The runner
+writes one JSON request per line on stdin and reads one JSON response per
+line on stdout:
+
+    request:  {"workspace": "/tmp/...", "model": "gpt-4o", "prompt": "...",
+               "test_cmd": "python test_publisher.py" | null, "env": {...},
+               "fnames": ["publisher.py"]}  # optional: files added to the chat
+    response: {"success": true, "output": "...", "iterations": 3}
+
+Everything Aider prints goes to stderr or into the response, never to the
+protocol stream. The process exits when stdin is closed.
+
+Usage (normally started by benchmark_runner.py or dual_agent_runner.py
+with --aider-server):
+    python aider_server.py
+"""
+
+import collections
+import contextlib
+import json
+import os
+import sys
+
+
+OUTPUT_TAIL_LINES = 4096
+
+
+class TailWriter:
+    """File-like sink keeping the last lines of Aider's output."""
+
+    def __init__(self, maxlen: int = OUTPUT_TAIL_LINES):
+        self.lines = collections.deque(maxlen=maxlen)
+        self.iterations = 0
+        self._partial = ""
+
+    def write(self, text: str) -> int:
+        text = self._partial + text
+        *complete, self._partial = text.split("\n")
+        for line in complete:
+            self.lines.append(line + "\n")
+            if "Applied edit" in line:
+                self.iterations += 1
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+    def getvalue(self) -> str:
+        return "".join(self.lines) + self._partial
+
+
+def run_request(request: dict, models: dict) -> dict:
+    """Run one Aider session in the request's workspace."""
+    from aider.coders import Coder
+    from aider.io import InputOutput
+    from aider.models import Model
+
+    model_name = request["model"]
+    if model_name not in models:
+        models[model_name] = Model(model_name)
+
+    os.environ.update(request.get("env") or {})
+    os.chdir(request["workspace"])
+
+    sink = TailWriter()
+    with contextlib.redirect_stdout(sink):
+        io = InputOutput(yes=True, pretty=False)
+        test_cmd = request.get("test_cmd")
+        coder = Coder.create(
+            main_model=models[model_name],
+            io=io,
+            fnames=request.get("fnames") or [],
+            use_git=False,
+            auto_commits=False,
+            test_cmd=test_cmd,
+            auto_test=bool(test_cmd),
+        )
+        coder.run(request["prompt"])
+
+    return {
+        "success": True,
+        "output": sink.getvalue(),
+        "iterations": sink.iterations,
+    }
+
+
+def main():
+    # Keep the protocol on a private copy of stdout; anything else written to
+    # fd 1 (Aider, test commands, native libraries) lands on stderr instead.
+    proto = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    try:
+        import aider  # noqa: F401
+    except ImportError:
+        print("ERROR: aider-chat is not installed", file=sys.stderr)
+        sys.exit(1)
+
+    base_env = dict(os.environ)
+    base_cwd = os.getcwd()
+    models = {}
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            response = run_request(json.loads(line), models)
+        except Exception as e:
+            response = {"success": False, "output": f"{type(e).__name__}: {e}", "iterations": 0}
+        finally:
+            # Don't let one run's environment leak into the next
+            os.environ.clear()
+            os.environ.update(base_env)
+            os.chdir(base_cwd)
+
+        proto.write(json.dumps(response) + "\n")
+        proto.flush()
+
+
+if __name__ == "__main__":
+    main()
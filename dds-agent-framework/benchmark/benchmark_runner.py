@@ -7,23 +7,632 @@ with deterministic verification using reference implementations.
 Usage:
     python benchmark_runner.py --task L1-PY-01 --model gpt-4o
     python benchmark_runner.py --task L1-PY-01 --model claude-sonnet-4-20250514
+
+    # Sweep several tasks x models with 4 worker processes
+    python benchmark_runner.py --task L1-PY-01 L1-PY-02 --model gpt-4o gpt-4.1 --workers 4
+
+    # Keep one Aider process alive across runs instead of one CLI per task
+    python benchmark_runner.py --task L1-PY-01 L1-PY-02 --model gpt-4o --aider-server
 """
 
 import argparse
+import atexit
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
+import pickle
+import select
 import shutil
+import signal
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from dds_tools.core.sample_comparator import SampleComparator
+    HAS_DDS_TOOLS = True
+except ImportError:
+    HAS_DDS_TOOLS = False
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Default QoS profile written into each isolated workspace. The task prompts
+# pin the domain ID, so concurrent runs are kept apart by giving every run its
+# own domain tag instead. Participants created with default QoS (the reference
+# subscriber, the generated code and Aider's test runs) load it through
+# NDDS_QOS_PROFILES.
+BENCHMARK_QOS_PROFILE = """<?xml version="1.0" encoding="UTF-8"?>
+<dds xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+     xsi:noNamespaceSchemaLocation="http://community.rti.com/schema/current/rti_dds_qos_profiles.xsd">
+    <qos_library name="DDSBenchmarkLibrary">
+        <qos_profile name="IsolatedRun" is_default_qos="true">
+            <participant_qos>
+{participant_qos}
+            </participant_qos>
+        </qos_profile>
+    </qos_library>
+</dds>
+"""
+
+DOMAIN_TAG_QOS = """\
+                <property>
+                    <value>
+                        <element>
+                            <name>dds.domain_participant.domain_tag</name>
+                            <value>{domain_tag}</value>
+                        </element>
+                    </value>
+                </property>"""
+
+# Publisher and subscriber always share a host, so discovery and data can go
+# over the shared-memory transport alone.
+SHMEM_ONLY_QOS = """\
+                <transport_builtin>
+                    <mask>SHMEM</mask>
+                </transport_builtin>
+                <discovery>
+                    <initial_peers>
+                        <element>shmem://</element>
+                    </initial_peers>
+                </discovery>"""
+
+# Children run in their own process group so a timeout can take down
+# everything they spawned (Aider's test runs, DDS helper processes, ...)
+# instead of leaving it bound to the benchmark domain.
+if os.name == "nt":
+    _NEW_PROCESS_GROUP = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _NEW_PROCESS_GROUP = {"start_new_session": True}
+
+
+def isolated_env(workspace: Path, domain_tag: Optional[str], shmem: bool = False) -> dict:
+    """Write a default QoS profile for one run and return an env using it.
+    
+    Every participant created by a child with this environment joins
+    `domain_tag`, so concurrent runs on the same domain ID stay separate.
+    Also used by dual_agent_runner.
+    """
+    participant_qos = []
+    if domain_tag:
+        participant_qos.append(DOMAIN_TAG_QOS.format(domain_tag=domain_tag))
+    if shmem:
+        participant_qos.append(SHMEM_ONLY_QOS)
+    
+    profile = workspace / "benchmark_qos.xml"
+    profile.write_text(BENCHMARK_QOS_PROFILE.format(
+        participant_qos="\n".join(participant_qos)
+    ))
+    
+    env = os.environ.copy()
+    env["NDDS_QOS_PROFILES"] = str(profile)
+    return env
+
+
+def wait_for_ready(proc: subprocess.Popen, timeout: float) -> bool:
+    """Block until a subscriber started with --ready prints READY on stdout.
+    
+    proc.stdout must be a text pipe. Returns False on timeout or if the
+    subscriber exits first. Also used by dual_agent_runner.
+    
+    The lines are read on a helper thread rather than polled with select():
+    a log line written in the same chunk as READY would leave READY in the
+    pipe's read buffer, where select() cannot see it. The thread stops at
+    READY, so later output stays on proc.stdout for the caller.
+    """
+    ready = threading.Event()
+    
+    def read():
+        for line in proc.stdout:
+            if line.strip() == "READY":
+                ready.set()
+                return
+        # EOF: the subscriber exited without becoming ready
+    
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    reader.join(timeout)
+    # On timeout the caller kills the subscriber, which ends the reader
+    return ready.is_set()
+
+
+@functools.lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """Absolute path of a PATH command, resolved once per process.
+
+    Spawning by absolute path skips execvp's walk over PATH for every
+    child; unknown commands are returned unchanged so Popen reports them.
+    Also used by dual_agent_runner.
+    """
+    return shutil.which(name) or name
+
+
+# Aider transcripts can run to megabytes; only the tail is kept for logs.
+AIDER_TAIL_LINES = 4096
+ERROR_LOG_MAX_CHARS = 16 * 1024
+
+# Serializes pass-index updates between verifier threads; flock on the
+# index's lock file covers other processes
+_PASS_INDEX_LOCK = threading.Lock()
+
+
+def _workspace_root() -> str:
+    """Directory for run workspaces: $DDS_BENCH_TMP, else tmpfs, else the temp dir."""
+    root = os.environ.get("DDS_BENCH_TMP")
+    if root:
+        return root
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def copy_file(src: Path, dst: Path):
+    """Copy src to dst as a separate inode, sharing extents where possible.
+
+    copy_file_range lets the kernel clone blocks (reflink on btrfs/XFS)
+    or copy them without a round trip through user space; anything it
+    can't handle falls back to shutil.copyfile. Permission bits are copied
+    as with shutil.copy. Also used by dual_agent_runner.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    remaining -= n
+            if remaining == 0:
+                shutil.copymode(src, dst)
+                return
+        except OSError:
+            # EXDEV on older kernels, ENOSYS, EINVAL on some filesystems
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+
+
+def _clone_file(src: Path, dst: Path):
+    """Hardlink src to dst, copying when linking is not possible.
+
+    Only use this for inputs the run never rewrites in place; an edit through
+    a hardlink would modify the task's own copy.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        # EXDEV (workspace on tmpfs), EPERM, or no link support
+        copy_file(src, dst)
+
+
+PUBLISHER_LOG = "pub.log"
+SUBSCRIBER_LOG = "sub.log"
+LOG_TAIL_BYTES = 8192
+
+# Launcher for the generated publisher: the interpreter starts and imports
+# the DDS bindings right away, but the script itself only runs once the
+# runner writes a line on stdin (or exits if stdin closes first).
+PUBLISHER_GATE = """\
+import runpy, sys
+try:
+    import rti.connextdds
+except ImportError:
+    pass
+if not sys.stdin.readline():
+    sys.exit(1)
+sys.argv = sys.argv[1:]
+runpy.run_path(sys.argv[0], run_name="__main__")
+"""
+
+
+def _log_tail(path: Path, limit: int = LOG_TAIL_BYTES) -> str:
+    """Return the last `limit` bytes of a child's log, decoded leniently."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - limit))
+            return f.read().decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def _terminate_group(proc: subprocess.Popen, sig: Optional[int] = None):
+    """Signal the process group led by proc (SIGKILL by default)."""
+    if os.name == "nt":
+        if proc.poll() is None:
+            proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL if sig is None else sig)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int, cache_file: str) -> dict:
+    """Parse path, consulting the on-disk pickle cache on an in-process miss.
+
+    The (mtime_ns, size) arguments only key the cache; an edited file gets a
+    new entry instead of a stale hit.
+    """
+    key = (path, mtime_ns, size)
+    
+    cache = {}
+    try:
+        with open(cache_file, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    
+    if key in cache:
+        return cache[key]
+    
+    with open(path) as f:
+        data = yaml.load(f.read(), Loader=SafeLoader)
+    
+    # Drop stale entries for this path before storing the new one
+    cache = {k: v for k, v in cache.items() if k[0] != path}
+    cache[key] = data
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+    return data
+
+
+@functools.lru_cache(maxsize=256)
+def _read_text_cached(path: str, mtime_ns: int) -> str:
+    """Read a text file (task prompts); mtime_ns only keys the cache."""
+    with open(path) as f:
+        return f.read()
+
+
+def _read_text(path: str) -> str:
+    """Return the contents of path, cached until its mtime changes."""
+    return _read_text_cached(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+
+class ResultsParquetLog:
+    """Buffer result rows and write them as Parquet parts.
+    
+    Parquet files can't be appended to once closed, so every flush writes a
+    new part under results/parquet/; read the directory as one dataset, e.g.
+    ``pyarrow.dataset.dataset("results/parquet")``.
+    """
+    
+    FLUSH_ROWS = 256
+    
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.rows: list[dict] = []
+        self._lock = threading.Lock()
+        # Buffered rows still reach disk if the process exits abruptly
+        atexit.register(self.flush)
+        self.schema = pa.schema([
+            ("task_id", pa.string()),
+            ("model", pa.string()),
+            ("success", pa.bool_()),
+            ("reason", pa.string()),
+            ("time_seconds", pa.float64()),
+            ("aider_iterations", pa.int32()),
+            ("samples_matched", pa.int32()),
+            ("samples_expected", pa.int32()),
+            ("checkpoints", pa.string()),  # JSON
+            ("error_log", pa.string()),
+            ("timestamp", pa.timestamp("ns")),
+            ("rubric_evaluator", pa.string()),
+            ("rubric_overall", pa.float64()),
+            ("from_cache", pa.bool_()),
+        ])
+    
+    def append(self, result: "BenchmarkResult") -> Path:
+        row = {
+            "task_id": result.task_id,
+            "model": result.model,
+            "success": result.success,
+            "reason": result.reason,
+            "time_seconds": result.time_seconds,
+            "aider_iterations": result.aider_iterations,
+            "samples_matched": result.samples_matched,
+            "samples_expected": result.samples_expected,
+            "checkpoints": json.dumps(result.checkpoints),
+            "error_log": result.error_log[-ERROR_LOG_MAX_CHARS:],
+            "timestamp": result.timestamp,
+            "rubric_evaluator": result.rubric_evaluator,
+            "rubric_overall": result.rubric_scores.overall if result.rubric_scores else None,
+            "from_cache": result.from_cache,
+        }
+        with self._lock:
+            self.rows.append(row)
+            if len(self.rows) >= self.FLUSH_ROWS:
+                self._flush_locked()
+        return self.directory
+    
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        if not self.rows:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pylist(self.rows, schema=self.schema)
+        part = self.directory / f"part-{time.time_ns()}-{os.getpid()}.parquet"
+        pq.write_table(table, part)
+        self.rows = []
+
+
+class DomainAllocator:
+    """Lease run slots from a range shared by every runner on this host.
+    
+    Leases live in a small JSON file ({slot: pid}) guarded by flock, so
+    separate benchmark_runner invocations never hand out the same slot.
+    Slots held by processes that have died are reclaimed.
+    
+    The task prompts fix the DDS domain ID the generated code uses, so a slot
+    isolates a run through its domain tag rather than a different domain ID.
+    """
+    
+    def __init__(self, path: Path, first: int, last: int):
+        self.path = path
+        self.first = first
+        self.last = last
+    
+    @staticmethod
+    def _alive(pid: int) -> bool:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+    
+    def _update(self, fn):
+        """Apply fn to the lease table under an exclusive lock."""
+        with open(self.path, "a+") as f:
+            if HAS_FCNTL:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    leases = {int(k): v for k, v in json.loads(f.read() or "{}").items()}
+                except ValueError:
+                    leases = {}
+                leases = {k: pid for k, pid in leases.items() if self._alive(pid)}
+                result = fn(leases)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(leases))
+                f.flush()
+                return result
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+    
+    def acquire(self, poll_interval: float = 0.5) -> int:
+        """Return the lowest free slot, waiting for one if all are leased."""
+        def take(leases):
+            for slot in range(self.first, self.last + 1):
+                if slot not in leases:
+                    leases[slot] = os.getpid()
+                    return slot
+            return None
+        
+        while True:
+            slot = self._update(take)
+            if slot is not None:
+                return slot
+            time.sleep(poll_interval)
+    
+    def release(self, slot: int):
+        self._update(lambda leases: leases.pop(slot, None))
+
+
+class AiderServerError(RuntimeError):
+    """The persistent Aider worker died or returned garbage."""
+
+
+class AiderServer:
+    """Client for a long-lived aider_server.py worker.
+
+    The worker is started lazily on the first request and restarted after a
+    crash, timeout, or cancellation.
+    """
+    
+    def __init__(self, script: Path, verbose: bool = False):
+        self.script = script
+        self.verbose = verbose
+        self.proc: Optional[subprocess.Popen] = None
+    
+    def start(self):
+        if self.proc is not None and self.proc.poll() is None:
+            return
+        if self.verbose:
+            print(f"Starting Aider server: {self.script}", file=sys.stderr)
+        self.proc = subprocess.Popen(
+            [sys.executable, str(self.script)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None if self.verbose else subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            **_NEW_PROCESS_GROUP,
+        )
+    
+    def close(self):
+        if self.proc is None:
+            return
+        _terminate_group(self.proc)
+        self.proc.wait()
+        self.proc = None
+    
+    def request(
+        self,
+        payload: dict,
+        timeout: float,
+        cancel_event: threading.Event,
+    ) -> Optional[dict]:
+        """Send one request and wait for its response.
+        
+        Returns None on timeout or cancellation (the worker is killed).
+        Raises AiderServerError if the worker dies.
+        """
+        self.start()
+        try:
+            self.proc.stdin.write(json.dumps(payload) + "\n")
+            self.proc.stdin.flush()
+        except OSError as e:
+            self.close()
+            raise AiderServerError(f"Aider server not accepting requests: {e}")
+        
+        deadline = time.monotonic() + timeout
+        while True:
+            if cancel_event.is_set() or time.monotonic() > deadline:
+                self.close()
+                return None
+            ready, _, _ = select.select([self.proc.stdout], [], [], 0.1)
+            if ready:
+                break
+        
+        line = self.proc.stdout.readline()
+        if not line:
+            self.close()
+            raise AiderServerError("Aider server exited")
+        try:
+            return json.loads(line)
+        except ValueError:
+            self.close()
+            raise AiderServerError(f"Bad response from Aider server: {line[:200]!r}")
+
+
+class ReferenceSubscriberDaemon:
+    """Client for a reference subscriber running with --daemon.
+    
+    The daemon is started lazily and serves one verification session per
+    connection over a UNIX socket, so DDS is initialized once per sweep.
+    """
+    
+    def __init__(self, script: str, verbose: bool = False):
+        self.script = script
+        self.verbose = verbose
+        self.control_path = os.path.join(
+            tempfile.gettempdir(),
+            f"dds_refsub_{os.getpid()}_{abs(hash(script)) % 10**8}.sock",
+        )
+        self.proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def start(self, wait_ready) -> bool:
+        """Start the daemon if needed; wait_ready(proc) blocks for READY."""
+        with self._lock:
+            if self.proc is not None and self.proc.poll() is None:
+                return True
+            if self.verbose:
+                print(f"Starting reference subscriber daemon: {self.script}", file=sys.stderr)
+            self.proc = subprocess.Popen(
+                [sys.executable, self.script, "--daemon", "--control", self.control_path],
+                # The daemon exits when this pipe closes, i.e. when we do
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=None if self.verbose else subprocess.DEVNULL,
+                text=True,
+                **_NEW_PROCESS_GROUP,
+            )
+            if not wait_ready(self.proc):
+                self.close()
+                return False
+            return True
+    
+    def close(self):
+        if self.proc is None:
+            return
+        _terminate_group(self.proc)
+        self.proc.wait()
+        self.proc = None
+    
+    def open_session(self, request: dict, timeout: float) -> tuple:
+        """Start a session; returns (socket, reply stream) once the reader is ready.
+        
+        Raises OSError (including socket.timeout) or ValueError on failure.
+        """
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stream = None
+        try:
+            sock.settimeout(timeout)
+            sock.connect(self.control_path)
+            sock.sendall((json.dumps(request) + "\n").encode())
+            stream = sock.makefile("rb")
+            reply = json.loads(self._read_line(stream))
+            if not reply.get("ready"):
+                raise OSError(f"Unexpected reply from subscriber daemon: {reply}")
+            return sock, stream
+        except (OSError, ValueError):
+            self.close_session((sock, stream))
+            raise
+    
+    def finish_session(self, session: tuple, timeout: float) -> dict:
+        """Wait for the session's result and close it."""
+        sock, stream = session
+        try:
+            sock.settimeout(timeout)
+            return json.loads(self._read_line(stream))
+        finally:
+            self.close_session(session)
+    
+    @staticmethod
+    def close_session(session: tuple):
+        sock, stream = session
+        if stream is not None:
+            stream.close()
+        sock.close()
+    
+    @staticmethod
+    def _read_line(stream) -> bytes:
+        line = stream.readline()
+        if not line:
+            raise OSError("Subscriber daemon closed the session")
+        return line
+
 
 @dataclass
 class TaskConfig:
@@ -39,6 +648,8 @@ class TaskConfig:
     prompt_file: str
     task_dir: Path
     test_script: str = ""  # Optional test script for iterative mode
+    ready_signal: bool = False  # Reference subscriber supports --ready
+    subscriber_daemon: bool = False  # Reference subscriber supports --daemon
 
 
 @dataclass
@@ -54,6 +665,35 @@ class RubricScores:
     summary: str = ""
 
 
+# Normalized rubric dimension name -> RubricScores field
+RUBRIC_DIMENSIONS = {
+    "prompt_following": "prompt_following",
+    "code_style": "code_style",
+    "correctness": "correctness",
+    "dds_best_practices": "dds_best_practices",
+    "error_handling": "error_handling",
+}
+# Keyword fallback, in priority order, for dimension names the evaluator
+# model paraphrased
+RUBRIC_KEYWORDS = (
+    ("prompt", "prompt_following"),
+    ("style", "code_style"),
+    ("correct", "correctness"),
+    ("dds", "dds_best_practices"),
+    ("practice", "dds_best_practices"),
+    ("error", "error_handling"),
+)
+
+
+def _rubric_field(dimension: str) -> Optional[str]:
+    """Map an evaluator's dimension name to a RubricScores field."""
+    dim = dimension.lower().replace(" ", "_")
+    attr = RUBRIC_DIMENSIONS.get(dim)
+    if attr is None:
+        attr = next((a for key, a in RUBRIC_KEYWORDS if key in dim), None)
+    return attr
+
+
 @dataclass
 class BenchmarkResult:
     """Result of a benchmark run."""
@@ -67,11 +707,29 @@ class BenchmarkResult:
     samples_expected: int = 0
     checkpoints: dict = field(default_factory=dict)
     error_log: str = ""
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: int = field(default_factory=time.time_ns)  # Wall clock, ns since epoch
     # Rubric evaluation (optional)
     rubric_scores: Optional[RubricScores] = None
     rubric_evaluator: str = ""
-    generated_code: str = ""
+    generated_code: str = ""  # Only filled in when the rubric runs
+    from_cache: bool = False  # Code came from the solution cache, not Aider
+
+
+@dataclass
+class PreparedRun:
+    """A run whose code generation is done, waiting for verification."""
+    task_id: str
+    model: str
+    task: Optional[TaskConfig] = None
+    workspace: Optional[Path] = None
+    env: Optional[dict] = None
+    domain_tag: Optional[str] = None
+    solution_dir: Optional[Path] = None
+    from_cache: bool = False
+    iterations: int = 0
+    generation_seconds: float = 0.0
+    # Set when the run already failed in phase 1
+    result: Optional[BenchmarkResult] = None
 
 
 class BenchmarkRunner:
@@ -90,40 +748,130 @@ class BenchmarkRunner:
         run_rubric: bool = False,
         rubric_evaluator: str = "anthropic/claude-opus-4-5",
         iterative: bool = True,  # Enable iterative mode by default
+        per_run_json: bool = False,
+        use_aider_server: bool = False,
+        shmem: bool = False,
+        domain_range: Optional[tuple[int, int]] = None,
+        solution_cache: bool = True,
+        refresh_cache: bool = False,
+        legacy_io: bool = False,
+        subscriber_daemon: bool = False,
+        skip_verify: bool = True,
+        legacy_json: bool = False,
+        workspace_root: Optional[str] = None,
+        keep_failed: bool = False,
     ):
         self.benchmark_dir = benchmark_dir
         self.verbose = verbose
         self.run_rubric = run_rubric
         self.rubric_evaluator = rubric_evaluator
         self.iterative = iterative
+        self.per_run_json = per_run_json
+        self.use_aider_server = use_aider_server
+        self.shmem = shmem
+        self.solution_cache = solution_cache
+        self.refresh_cache = refresh_cache
+        self.legacy_io = legacy_io
+        self.subscriber_daemon = subscriber_daemon
+        self.skip_verify = skip_verify
+        self.workspace_root = workspace_root
+        self.keep_failed = keep_failed
+        # Failed workspaces, kept for inspection until the process exits
+        self._failed_workspaces: list[Path] = []
+        # Parquet is the default results log when pyarrow is available
+        self._parquet_log: Optional[ResultsParquetLog] = None
+        if HAS_PYARROW and not legacy_json and not per_run_json:
+            self._parquet_log = ResultsParquetLog(benchmark_dir / "results" / "parquet")
+        self._subscriber_daemons: dict[str, ReferenceSubscriberDaemon] = {}
+        # Verifier threads look up and create daemons concurrently
+        self._daemons_lock = threading.Lock()
+        # expected_output path -> (mtime_ns, parsed samples)
+        self._expected_cache: dict[str, tuple[int, list]] = {}
+        self._aider_server: Optional[AiderServer] = None
+        # RubricEvaluator, created on first use (it holds the API client)
+        self._rubric = None
         self.config = self._load_config()
+        # Task directory name -> path, and canonical task ID -> path
+        self._task_dirs = self._index_tasks()
+        self._task_index: dict[str, str] = {}
+        for name, path in self._task_dirs.items():
+            self._task_index.setdefault(name.split("_", 1)[0], path)
+        first, last = domain_range or self.config.get("dds", {}).get(
+            "domain_id_range", (80, 99)
+        )
+        self.domains = DomainAllocator(self.benchmark_dir / ".domains", first, last)
+        # Set from another thread to abort the current Aider run
+        self.cancel_event = threading.Event()
+    
+    def __getstate__(self) -> dict:
+        # threading.Event is not picklable; worker processes get their own
+        state = self.__dict__.copy()
+        del state["cancel_event"]
+        # Each process starts its own Aider worker
+        state["_aider_server"] = None
+        state["_rubric"] = None
+        state["_subscriber_daemons"] = {}
+        del state["_daemons_lock"]
+        state["_expected_cache"] = {}
+        # Workers only generate code; results are saved by the parent
+        state["_parquet_log"] = None
+        return state
+    
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self.cancel_event = threading.Event()
+        self._daemons_lock = threading.Lock()
         
+    def _load_yaml(self, path: str) -> dict:
+        """Parse a YAML file, reusing cached results while it is unchanged.
+
+        Parsed files are memoized in-process and in ``.cache/tasks.pkl``
+        keyed by (path, mtime_ns, size), so sweeps over many models reparse
+        nothing and repeated invocations skip PyYAML entirely. Callers must
+        treat the returned dict as read-only.
+        """
+        st = os.stat(path)
+        cache_file = os.path.join(self.benchmark_dir, ".cache", "tasks.pkl")
+        return _load_yaml_cached(
+            os.path.abspath(path), st.st_mtime_ns, st.st_size, cache_file
+        )
+    
     def _load_config(self) -> dict:
         """Load benchmark configuration."""
-        config_path = self.benchmark_dir / "config.yaml"
-        with open(config_path) as f:
-            return yaml.safe_load(f)
+        return self._load_yaml(os.path.join(self.benchmark_dir, "config.yaml"))
+    
+    def _index_tasks(self) -> dict[str, str]:
+        """Map task directory names to paths, sorted, from one scandir pass."""
+        tasks_dir = os.path.join(self.benchmark_dir, "tasks")
+        with os.scandir(tasks_dir) as entries:
+            return dict(sorted(
+                (entry.name, entry.path) for entry in entries if entry.is_dir()
+            ))
+    
+    def _find_task_dir(self, task_id: str) -> str:
+        """Resolve a task ID (e.g. L1-PY-01) to its directory.
+
+        Directories are named ``<task_id>_<slug>``; an exact ID match wins,
+        otherwise the first directory whose name contains task_id is used.
+        """
+        if task_id in self._task_index:
+            return self._task_index[task_id]
+        for name, path in self._task_dirs.items():
+            if task_id in name:
+                return path
+        tasks_dir = os.path.join(self.benchmark_dir, "tasks")
+        raise ValueError(f"Task {task_id} not found in {tasks_dir}")
     
     def _load_task(self, task_id: str) -> TaskConfig:
         """Load task configuration."""
-        # Find task directory
-        tasks_dir = self.benchmark_dir / "tasks"
-        task_dirs = list(tasks_dir.glob(f"*{task_id}*"))
-        
-        if not task_dirs:
-            raise ValueError(f"Task {task_id} not found in {tasks_dir}")
-        
-        task_dir = task_dirs[0]
-        task_yaml = task_dir / "task.yaml"
-        
-        with open(task_yaml) as f:
-            task_config = yaml.safe_load(f)
+        task_dir = self._find_task_dir(task_id)
+        task_config = self._load_yaml(os.path.join(task_dir, "task.yaml"))
+        verification = task_config["verification"]
         
         # Check for test script
-        test_script = ""
-        test_script_path = task_dir / "test_publisher.py"
-        if test_script_path.exists():
-            test_script = str(test_script_path)
+        test_script = os.path.join(task_dir, "test_publisher.py")
+        if not os.path.exists(test_script):
+            test_script = ""
         
         return TaskConfig(
             task_id=task_config["task_id"],
@@ -132,37 +880,61 @@ class BenchmarkRunner:
             domain_id=task_config["requirements"]["domain_id"],
             sample_count=task_config["requirements"]["sample_count"],
             timeout_seconds=task_config["timeout_seconds"],
-            reference_subscriber=str(task_dir / task_config["verification"]["reference_subscriber"]),
-            expected_output=str(task_dir / task_config["verification"]["expected_output"]),
-            prompt_file=str(task_dir / "prompt.md"),
-            task_dir=task_dir,
+            reference_subscriber=os.path.join(task_dir, verification["reference_subscriber"]),
+            expected_output=os.path.join(task_dir, verification["expected_output"]),
+            prompt_file=os.path.join(task_dir, "prompt.md"),
+            task_dir=Path(task_dir),
             test_script=test_script,
+            ready_signal=verification.get("ready_signal", False),
+            subscriber_daemon=verification.get("daemon", False),
         )
     
     def _setup_workspace(self, task: TaskConfig) -> Path:
         """Create isolated workspace for benchmark run."""
-        workspace = Path(tempfile.mkdtemp(prefix=f"dds_bench_{task.task_id}_"))
+        workspace = Path(tempfile.mkdtemp(
+            prefix=f"dds_bench_{task.task_id}_", dir=self.workspace_root or _workspace_root()
+        ))
         
-        # Copy starter files if any
-        starter_dir = task.task_dir / "starter"
-        if starter_dir.exists():
-            for f in starter_dir.iterdir():
-                if f.is_file():
-                    shutil.copy(f, workspace)
+        # Copy starter files if any; one scandir pass, with file types from
+        # the directory entries instead of a stat per file
+        try:
+            with os.scandir(task.task_dir / "starter") as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    if entry.name == task.target_file:
+                        # The model edits this one; it needs its own inode
+                        copy_file(entry.path, workspace / entry.name)
+                    else:
+                        _clone_file(entry.path, workspace / entry.name)
+        except FileNotFoundError:
+            pass  # Task has no starter files
         
         # Copy test script if iterative mode
         if self.iterative and task.test_script:
-            shutil.copy(task.test_script, workspace / "test_publisher.py")
+            copy_file(task.test_script, workspace / "test_publisher.py")
             # Also copy reference directory for test script to use
             ref_dir = task.task_dir / "reference"
             if ref_dir.exists():
-                shutil.copytree(ref_dir, workspace / "reference")
+                shutil.copytree(ref_dir, workspace / "reference", copy_function=copy_file)
         
         if self.verbose:
             print(f"Workspace: {workspace}", file=sys.stderr)
         
         return workspace
     
+    def _solution_dir(self, task: TaskConfig, model: str, prompt: str) -> Path:
+        """Cache directory for a (prompt, model, task, mode) combination."""
+        mode = "iterative" if self.iterative else "single-shot"
+        key = hashlib.sha256(
+            "\0".join((prompt, model, task.task_id, mode)).encode()
+        ).hexdigest()
+        return self.benchmark_dir / ".cache" / "solutions" / key
+    
+    def _isolated_env(self, workspace: Path, domain_tag: Optional[str]) -> dict:
+        """Write the per-run QoS profile and return the environment using it."""
+        return isolated_env(workspace, domain_tag, self.shmem)
+    
     def _run_aider(
         self,
         workspace: Path,
@@ -171,6 +943,7 @@ class BenchmarkRunner:
         timeout: int,
         test_cmd: str = None,
         max_iterations: int = 10,
+        env: Optional[dict] = None,
     ) -> tuple[bool, str, int]:
         """Run Aider to generate code with iterative testing.
         
@@ -180,10 +953,20 @@ class BenchmarkRunner:
         3. If test fails, show error to model and let it fix
         4. Repeat until success or max_iterations
         
+        Aider's output is drained line by line on a reader thread while this
+        thread polls for exit, the timeout, or `self.cancel_event`.
+        
         Returns: (success, output, iterations)
         """
+        if self.use_aider_server and os.name != "nt":
+            result = self._run_aider_server(
+                workspace, model, prompt, timeout, test_cmd, env
+            )
+            if result is not None:
+                return result
+        
         cmd = [
-            "aider",
+            resolve_executable("aider"),
             "--model", model,
             "--yes",  # Non-interactive (auto-accept edits)
             "--no-git",  # Don't use git in workspace
@@ -205,38 +988,162 @@ class BenchmarkRunner:
                 print(f"  Test command: {test_cmd}", file=sys.stderr)
         
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
                 cwd=workspace,
-                timeout=timeout,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                env=env,
+                **_NEW_PROCESS_GROUP,
             )
-            
-            output = result.stdout + result.stderr
-            
-            # Count iterations from output
-            iterations = output.count("Applied edit")
-            
-            # Count test runs
-            test_runs = output.count("Running test")
-            if test_runs > 0 and self.verbose:
-                print(f"  Test runs: {test_runs}", file=sys.stderr)
-            
-            return result.returncode == 0, output, iterations
-            
-        except subprocess.TimeoutExpired:
-            return False, "Aider timed out", 0
         except Exception as e:
             return False, str(e), 0
+        
+        # Lines stay bytes; only the kept tail is ever decoded
+        tail = collections.deque(maxlen=AIDER_TAIL_LINES)
+        iterations = 0
+        test_runs = 0
+        
+        def drain():
+            nonlocal iterations, test_runs
+            for line in proc.stdout:
+                tail.append(line)
+                if b"Applied edit" in line:
+                    iterations += 1
+                if b"Running test" in line:
+                    test_runs += 1
+        
+        reader = threading.Thread(target=drain, daemon=True)
+        reader.start()
+        
+        deadline = time.monotonic() + timeout
+        while proc.poll() is None:
+            if self.cancel_event.is_set() or time.monotonic() > deadline:
+                _terminate_group(proc, signal.SIGTERM if os.name != "nt" else None)
+                try:
+                    proc.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    pass
+                _terminate_group(proc)
+                proc.wait()
+                reader.join(timeout=1)
+                if self.cancel_event.is_set():
+                    return False, "Aider cancelled", iterations
+                return False, "Aider timed out", iterations
+            time.sleep(0.1)
+        
+        # A grandchild that inherited stdout (an auto-test run, a git hook)
+        # keeps the pipe open after Aider exits; kill what is left of the
+        # process group rather than wait for an EOF that never comes
+        reader.join(timeout=1)
+        if reader.is_alive():
+            _terminate_group(proc)
+            reader.join(timeout=1)
+        output = b"".join(tail).decode(errors="replace")
+        
+        if test_runs > 0 and self.verbose:
+            print(f"  Test runs: {test_runs}", file=sys.stderr)
+        
+        return proc.returncode == 0, output, iterations
+    
+    def _wait_for_ready(self, proc: subprocess.Popen, timeout: float) -> bool:
+        """Block until the subscriber prints READY on stdout."""
+        return wait_for_ready(proc, timeout)
+    
+    def _run_aider_server(
+        self,
+        workspace: Path,
+        model: str,
+        prompt: str,
+        timeout: int,
+        test_cmd: Optional[str],
+        env: Optional[dict],
+    ) -> Optional[tuple[bool, str, int]]:
+        """Run Aider through the persistent worker.
+        
+        Returns None if the worker crashed so the caller can spawn the CLI.
+        """
+        if self._aider_server is None:
+            self._aider_server = AiderServer(
+                Path(__file__).with_name("aider_server.py"), verbose=self.verbose
+            )
+        
+        # Only ship variables that differ from our own environment
+        env_delta = {}
+        if env:
+            env_delta = {k: v for k, v in env.items() if os.environ.get(k) != v}
+        
+        payload = {
+            "workspace": str(workspace),
+            "model": model,
+            "prompt": prompt,
+            "test_cmd": test_cmd,
+            "env": env_delta,
+        }
+        try:
+            response = self._aider_server.request(payload, timeout, self.cancel_event)
+        except AiderServerError as e:
+            print(f"  {e}; falling back to aider CLI", file=sys.stderr)
+            return None
+        
+        if response is None:
+            if self.cancel_event.is_set():
+                return False, "Aider cancelled", 0
+            return False, "Aider timed out", 0
+        
+        return response["success"], response["output"], response["iterations"]
+    
+    def _start_publisher(
+        self,
+        workspace: Path,
+        task: TaskConfig,
+        env: Optional[dict],
+        gated: bool = False,
+    ) -> subprocess.Popen:
+        """Start the generated publisher, logging to pub.log in the workspace.
+        
+        With gated=True the process starts behind PUBLISHER_GATE and waits
+        for _release_publisher, so its start-up overlaps the subscriber's.
+        """
+        if self.verbose:
+            print(f"Running publisher...", file=sys.stderr)
+        
+        script = str(workspace / task.target_file)
+        python = resolve_executable("python")
+        cmd = [python, "-c", PUBLISHER_GATE, script] if gated else [python, script]
+        with open(workspace / PUBLISHER_LOG, "wb") as pub_log:
+            return subprocess.Popen(
+                cmd,
+                cwd=workspace,
+                stdin=subprocess.PIPE if gated else None,
+                stdout=pub_log,
+                stderr=subprocess.STDOUT,
+                env=env,
+                **_NEW_PROCESS_GROUP,
+            )
+    
+    def _release_publisher(self, proc: subprocess.Popen):
+        """Let a gated publisher run its script."""
+        try:
+            proc.stdin.write(b"go\n")
+            proc.stdin.close()
+        except OSError:
+            pass  # Already exited; its return code is reported by the caller
     
     def _run_verification(
         self,
         workspace: Path,
         task: TaskConfig,
+        env: Optional[dict] = None,
+        domain_tag: Optional[str] = None,
     ) -> tuple[bool, int, int, str]:
         """Run the generated publisher against reference subscriber.
         
+        The subscriber streams its JSONL samples over stdout and they are
+        compared in-process. With `legacy_io` it writes actual_output.jsonl
+        instead, which is read back and compared in-process too; only
+        without dds_tools installed is the file handed to dds-sample-compare.
+        
         Returns: (success, matched, expected, error_log)
         """
         publisher_path = workspace / task.target_file
@@ -244,64 +1151,118 @@ class BenchmarkRunner:
         if not publisher_path.exists():
             return False, 0, task.sample_count, "Publisher file not created"
         
+        stream = HAS_DDS_TOOLS and not self.legacy_io
+        
+        if stream and self.subscriber_daemon and task.subscriber_daemon and os.name != "nt":
+            result = self._run_verification_daemon(workspace, task, env, domain_tag)
+            if result is not None:
+                return result
+        
         # Create output file for subscriber
         output_file = workspace / "actual_output.jsonl"
         
+        sub_proc = None
+        pub_proc = None
         try:
             # Start reference subscriber first
             sub_cmd = [
-                "python", task.reference_subscriber,
+                resolve_executable("python"), task.reference_subscriber,
                 "--domain", str(task.domain_id),
                 "--count", str(task.sample_count),
                 "--timeout", "20",
-                "--output", str(output_file),
             ]
+            if not stream:
+                sub_cmd.extend(["--output", str(output_file)])
+            if task.ready_signal:
+                sub_cmd.append("--ready")
             
             if self.verbose:
                 print(f"Starting subscriber...", file=sys.stderr)
             
-            sub_proc = subprocess.Popen(
-                sub_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
+            # Logs go straight to files in the workspace; they are only read
+            # back when something fails
+            with open(workspace / SUBSCRIBER_LOG, "wb") as sub_log:
+                sub_proc = subprocess.Popen(
+                    sub_cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=sub_log,
+                    text=True,
+                    env=env,
+                    **_NEW_PROCESS_GROUP,
+                )
             
-            # Wait for subscriber to start
-            time.sleep(2)
+            # Bring the publisher's interpreter up while the subscriber starts
+            pub_proc = self._start_publisher(workspace, task, env, gated=True)
             
-            # Run the generated publisher
-            pub_cmd = ["python", str(publisher_path)]
+            # Wait for subscriber to start
+            if task.ready_signal and os.name != "nt":
+                if not self._wait_for_ready(sub_proc, timeout=5.0):
+                    return (
+                        False, 0, task.sample_count,
+                        "Subscriber did not become ready\n"
+                        + _log_tail(workspace / SUBSCRIBER_LOG),
+                    )
+            else:
+                time.sleep(2)
             
-            if self.verbose:
-                print(f"Running publisher...", file=sys.stderr)
+            if stream:
+                # Drain samples as they arrive so the subscriber never blocks
+                # on a full pipe while the publisher is running
+                sample_lines = []
+                
+                def collect():
+                    for line in sub_proc.stdout:
+                        if line.startswith("{"):
+                            sample_lines.append(line)
+                
+                collector = threading.Thread(target=collect, daemon=True)
+                collector.start()
             
-            pub_result = subprocess.run(
-                pub_cmd,
-                cwd=workspace,
-                timeout=30,
-                capture_output=True,
-                text=True,
-            )
+            # Run the generated publisher
+            self._release_publisher(pub_proc)
+            pub_proc.wait(timeout=30)
             
             # Wait for subscriber to complete
-            try:
-                sub_stdout, sub_stderr = sub_proc.communicate(timeout=15)
-            except subprocess.TimeoutExpired:
-                sub_proc.kill()
-                sub_stdout, sub_stderr = sub_proc.communicate()
+            if stream:
+                try:
+                    sub_proc.wait(timeout=15)
+                except subprocess.TimeoutExpired:
+                    _terminate_group(sub_proc)
+                    sub_proc.wait()
+                collector.join()
+            else:
+                try:
+                    sub_proc.communicate(timeout=15)
+                except subprocess.TimeoutExpired:
+                    _terminate_group(sub_proc)
+                    sub_proc.communicate()
             
-            if pub_result.returncode != 0:
-                return False, 0, task.sample_count, f"Publisher failed: {pub_result.stderr}"
+            if pub_proc.returncode != 0:
+                return (
+                    False, 0, task.sample_count,
+                    f"Publisher failed:\n{_log_tail(workspace / PUBLISHER_LOG)}",
+                )
+            
+            loads = orjson.loads if HAS_ORJSON else json.loads
+            if stream:
+                return self._compare_samples(
+                    task, [loads(line) for line in sample_lines]
+                )
             
-            # Compare output using dds-sample-compare
             if not output_file.exists():
                 return False, 0, task.sample_count, "No samples received"
             
+            if HAS_DDS_TOOLS:
+                with open(output_file, "rb") as f:
+                    actual = [loads(line) for line in f if line.strip()]
+                return self._compare_samples(task, actual)
+            
+            # Compare output using dds-sample-compare
             compare_cmd = [
-                "dds-sample-compare",
+                resolve_executable("dds-sample-compare"),
                 "--expected", task.expected_output,
                 "--actual", str(output_file),
+                "--json",
             ]
             
             compare_result = subprocess.run(
@@ -316,15 +1277,10 @@ class BenchmarkRunner:
                 matched = task.sample_count
                 return True, matched, task.sample_count, ""
             else:
-                # Try to parse how many matched
-                output = compare_result.stdout
-                matched = 0
-                for line in output.split("\n"):
-                    if "Matched samples:" in line:
-                        try:
-                            matched = int(line.split(":")[-1].strip())
-                        except ValueError:
-                            pass
+                try:
+                    matched = json.loads(compare_result.stdout)["matched_count"]
+                except (ValueError, KeyError, TypeError):
+                    matched = 0
                 
                 return False, matched, task.sample_count, compare_result.stdout
                 
@@ -332,37 +1288,189 @@ class BenchmarkRunner:
             return False, 0, task.sample_count, "Verification timed out"
         except Exception as e:
             return False, 0, task.sample_count, str(e)
+        finally:
+            # Reap anything the children left behind on the domain
+            for proc in (pub_proc, sub_proc):
+                if proc is not None:
+                    _terminate_group(proc)
+                    if proc.poll() is None:
+                        proc.wait()
+    
+    def _run_verification_daemon(
+        self,
+        workspace: Path,
+        task: TaskConfig,
+        env: Optional[dict],
+        domain_tag: Optional[str],
+    ) -> Optional[tuple[bool, int, int, str]]:
+        """Verify through the long-lived reference subscriber daemon.
+        
+        Returns None if the daemon is unavailable so the caller can fall
+        back to a one-shot subscriber.
+        """
+        with self._daemons_lock:
+            daemon = self._subscriber_daemons.get(task.reference_subscriber)
+            if daemon is None:
+                daemon = ReferenceSubscriberDaemon(task.reference_subscriber, verbose=self.verbose)
+                self._subscriber_daemons[task.reference_subscriber] = daemon
+        
+        if not daemon.start(lambda proc: self._wait_for_ready(proc, timeout=30.0)):
+            print("  Subscriber daemon failed to start; using one-shot subscriber", file=sys.stderr)
+            return None
+        
+        request = {
+            "domain": task.domain_id,
+            "count": task.sample_count,
+            "timeout": 20,
+            "domain_tag": domain_tag,
+            "shmem": self.shmem,
+        }
+        # Bring the publisher's interpreter up while the session starts
+        pub_proc = self._start_publisher(workspace, task, env, gated=True)
+        try:
+            session = daemon.open_session(request, timeout=5.0)
+        except (OSError, ValueError) as e:
+            print(f"  Subscriber daemon session failed ({e}); restarting it", file=sys.stderr)
+            daemon.close()
+            _terminate_group(pub_proc)
+            pub_proc.wait()
+            return None
+        
+        try:
+            self._release_publisher(pub_proc)
+            pub_proc.wait(timeout=30)
+            
+            # The session ends after `count` samples or its own 20s timeout
+            result = daemon.finish_session(session, timeout=25.0)
+            session = None
+            
+            if pub_proc.returncode != 0:
+                return (
+                    False, 0, task.sample_count,
+                    f"Publisher failed:\n{_log_tail(workspace / PUBLISHER_LOG)}",
+                )
+            
+            return self._compare_samples(task, result["samples"])
+        except subprocess.TimeoutExpired:
+            return False, 0, task.sample_count, "Verification timed out"
+        except (OSError, ValueError) as e:
+            # The session is gone; don't reuse a daemon in an unknown state
+            daemon.close()
+            return False, 0, task.sample_count, f"Subscriber daemon failed: {e}"
+        finally:
+            if session is not None:
+                daemon.close_session(session)
+            _terminate_group(pub_proc)
+            if pub_proc.poll() is None:
+                pub_proc.wait()
+    
+    def _expected_samples(self, path: str) -> list[dict]:
+        """Parsed expected output, cached per file until it changes on disk."""
+        mtime_ns = os.stat(path).st_mtime_ns
+        cached = self._expected_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        loads = orjson.loads if HAS_ORJSON else json.loads
+        with open(path, "rb") as f:
+            samples = [loads(line) for line in f if line.strip()]
+        self._expected_cache[path] = (mtime_ns, samples)
+        return samples
+    
+    def _compare_samples(
+        self,
+        task: TaskConfig,
+        actual: list[dict],
+    ) -> tuple[bool, int, int, str]:
+        """Compare received samples against the task's expected output."""
+        if not actual:
+            return False, 0, task.sample_count, "No samples received"
+        
+        expected = self._expected_samples(task.expected_output)
+        result = SampleComparator().compare_samples(actual, expected)
+        if result.passed:
+            return True, task.sample_count, task.sample_count, ""
+        return False, result.matched_count, task.sample_count, result.to_json()
     
-    def run_benchmark(self, task_id: str, model: str) -> BenchmarkResult:
+    def run_benchmark(
+        self,
+        task_id: str,
+        model: str,
+        domain_tag: Optional[str] = None,
+    ) -> BenchmarkResult:
         """Run a complete benchmark.
         
+        Every DDS participant of this run (Aider's test runs included) is
+        confined to a domain tag so it cannot see other runs sharing the
+        task's domain ID. Unless domain_tag is given, the tag comes from a
+        slot leased from `self.domains` for the duration of the run.
+        
         Returns BenchmarkResult with all metrics.
         """
+        if domain_tag is not None:
+            try:
+                return self._run_benchmark(task_id, model, domain_tag)
+            finally:
+                self.flush_results()
+        
+        slot = self.domains.acquire()
+        try:
+            return self._run_benchmark(task_id, model, f"dds_bench_{slot}")
+        finally:
+            self.domains.release(slot)
+            self.flush_results()
+    
+    def _run_benchmark(
+        self,
+        task_id: str,
+        model: str,
+        domain_tag: Optional[str],
+    ) -> BenchmarkResult:
+        prepared = self._prepare_run(task_id, model, domain_tag)
+        if prepared.result is not None:
+            self._cleanup_workspace(prepared.workspace, success=False)
+            return prepared.result
+        return self._complete_run(prepared)
+    
+    def _prepare_run(
+        self,
+        task_id: str,
+        model: str,
+        domain_tag: Optional[str],
+    ) -> PreparedRun:
+        """Phase 1: set up the workspace and generate code.
+        
+        If the run already failed, the returned PreparedRun carries its
+        final result, plus its workspace if one was created; the caller
+        decides whether to keep it.
+        """
         print(f"\n{'='*60}")
         print(f"Benchmark: {task_id} | Model: {model}")
         print(f"{'='*60}")
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         # Load task
         try:
             task = self._load_task(task_id)
         except Exception as e:
-            return BenchmarkResult(
+            return PreparedRun(task_id, model, result=BenchmarkResult(
                 task_id=task_id,
                 model=model,
                 success=False,
                 reason=f"Failed to load task: {e}",
-            )
+            ))
         
         print(f"Task: {task.name}")
         
         # Setup workspace
         workspace = self._setup_workspace(task)
+        env = None
+        if domain_tag or self.shmem:
+            env = self._isolated_env(workspace, domain_tag)
         
         # Load prompt
-        with open(task.prompt_file) as f:
-            prompt = f.read()
+        prompt = _read_text(task.prompt_file)
         
         # Run Aider
         mode_str = "(iterative)" if self.iterative else "(single-shot)"
@@ -373,65 +1481,172 @@ class BenchmarkRunner:
         if self.iterative and (workspace / "test_publisher.py").exists():
             test_cmd = f"python test_publisher.py"
         
-        aider_success, aider_output, iterations = self._run_aider(
-            workspace, model, prompt, task.timeout_seconds,
-            test_cmd=test_cmd,
+        solution_dir = self._solution_dir(task, model, prompt)
+        cached_solution = solution_dir / task.target_file
+        from_cache = (
+            self.solution_cache
+            and not self.refresh_cache
+            and cached_solution.exists()
         )
         
+        if from_cache:
+            copy_file(cached_solution, workspace / task.target_file)
+            aider_success, aider_output, iterations = True, "", 0
+            print(f"  Using cached solution ({solution_dir.name[:12]})")
+        else:
+            aider_success, aider_output, iterations = self._run_aider(
+                workspace, model, prompt, task.timeout_seconds,
+                test_cmd=test_cmd,
+                env=env,
+            )
+        
         if self.verbose:
             print(f"Aider output:\n{aider_output[:1000]}...", file=sys.stderr)
         
         if not aider_success:
-            return BenchmarkResult(
+            return PreparedRun(task_id, model, workspace=workspace, result=BenchmarkResult(
                 task_id=task_id,
                 model=model,
                 success=False,
                 reason="Aider failed to generate code",
-                time_seconds=time.time() - start_time,
+                time_seconds=(time.monotonic_ns() - start_ns) / 1e9,
                 aider_iterations=iterations,
                 error_log=aider_output,
-            )
+            ))
         
         print(f"  Code generated ({iterations} edits)")
         
         # Verify the generated publisher exists
         publisher_file = workspace / task.target_file
         if not publisher_file.exists():
-            return BenchmarkResult(
+            return PreparedRun(task_id, model, workspace=workspace, result=BenchmarkResult(
                 task_id=task_id,
                 model=model,
                 success=False,
                 reason=f"Target file {task.target_file} not created",
-                time_seconds=time.time() - start_time,
+                time_seconds=(time.monotonic_ns() - start_ns) / 1e9,
                 aider_iterations=iterations,
-            )
+            ))
         
-        # Run verification
-        print(f"\nPhase 2: Verification (Reference Subscriber)")
-        verify_success, matched, expected, error_log = self._run_verification(
-            workspace, task
+        return PreparedRun(
+            task_id,
+            model,
+            task=task,
+            workspace=workspace,
+            env=env,
+            domain_tag=domain_tag,
+            solution_dir=solution_dir,
+            from_cache=from_cache,
+            iterations=iterations,
+            generation_seconds=(time.monotonic_ns() - start_ns) / 1e9,
         )
+    
+    def _code_hash(self, task: TaskConfig, code: bytes) -> str:
+        """Identify generated code together with the output it must produce."""
+        digest = hashlib.blake2b(code, digest_size=16)
+        with open(task.expected_output, "rb") as f:
+            digest.update(f.read())
+        return digest.hexdigest()
+    
+    def _pass_index_path(self, task: TaskConfig) -> str:
+        return os.path.join(self.benchmark_dir, ".cache", "pass_index", f"{task.task_id}.json")
+    
+    def _known_pass(self, task: TaskConfig, code_hash: str) -> Optional[int]:
+        """Matched count of an earlier passing run of identical code, if any."""
+        try:
+            with open(self._pass_index_path(task)) as f:
+                return json.load(f).get(code_hash)
+        except (OSError, ValueError):
+            return None
+    
+    def _record_pass(self, task: TaskConfig, code_hash: str, matched: int):
+        """Add a pass to the task's index without losing concurrent updates.
+        
+        The read-modify-write runs under a thread lock and an flock on a
+        sibling .lock file; the index itself is still replaced atomically,
+        so _known_pass never reads a partial file.
+        """
+        path = self._pass_index_path(task)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with _PASS_INDEX_LOCK, open(f"{path}.lock", "a") as lock:
+                if HAS_FCNTL:
+                    fcntl.flock(lock, fcntl.LOCK_EX)
+                try:
+                    try:
+                        with open(path) as f:
+                            index = json.load(f)
+                    except (OSError, ValueError):
+                        index = {}
+                    index[code_hash] = matched
+                    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                    with open(tmp, "w") as f:
+                        json.dump(index, f)
+                    os.replace(tmp, path)
+                finally:
+                    if HAS_FCNTL:
+                        fcntl.flock(lock, fcntl.LOCK_UN)
+        except OSError:
+            pass
+    
+    def _complete_run(self, prepared: PreparedRun) -> BenchmarkResult:
+        """Phases 2 and 3: verify, score, save, and clean up the workspace."""
+        task = prepared.task
+        workspace = prepared.workspace
+        iterations = prepared.iterations
+        publisher_file = workspace / task.target_file
+        start_ns = time.monotonic_ns()
         
-        elapsed = time.time() - start_time
+        # Read generated code for the pass index; it is only decoded when
+        # the rubric needs the text
+        code_bytes = publisher_file.read_bytes() if publisher_file.exists() else b""
+        generated_code = code_bytes.decode(errors="replace") if self.run_rubric else ""
+        code_hash = self._code_hash(task, code_bytes)
         
-        # Read generated code for rubric evaluation
-        generated_code = ""
-        if publisher_file.exists():
-            generated_code = publisher_file.read_text()
+        # Run verification, unless this exact code already passed
+        print(f"\nPhase 2: Verification (Reference Subscriber) [{prepared.task_id} | {prepared.model}]")
+        known_matched = self._known_pass(task, code_hash) if self.skip_verify else None
+        if known_matched is not None:
+            print(f"  Identical code passed before ({code_hash[:12]}); skipping")
+            verify_success, matched, expected, error_log = (
+                True, known_matched, task.sample_count, ""
+            )
+        else:
+            verify_success, matched, expected, error_log = self._run_verification(
+                workspace, task, env=prepared.env, domain_tag=prepared.domain_tag
+            )
+            if verify_success:
+                self._record_pass(task, code_hash, matched)
+        
+        # Time spent queued between the phases is not part of the run
+        elapsed = prepared.generation_seconds + (time.monotonic_ns() - start_ns) / 1e9
+        
+        if verify_success:
+            reason = "All samples matched"
+            if known_matched is not None:
+                reason += " (previously verified)"
+        else:
+            reason = f"Matched {matched}/{expected}"
         
         result = BenchmarkResult(
-            task_id=task_id,
-            model=model,
+            task_id=prepared.task_id,
+            model=prepared.model,
             success=verify_success,
-            reason="All samples matched" if verify_success else f"Matched {matched}/{expected}",
+            reason=reason,
             time_seconds=elapsed,
             aider_iterations=iterations,
             samples_matched=matched,
             samples_expected=expected,
             error_log=error_log,
             generated_code=generated_code,
+            from_cache=prepared.from_cache,
         )
         
+        # Remember solutions that verified so re-runs can skip Aider
+        if verify_success and self.solution_cache and not prepared.from_cache:
+            prepared.solution_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy(publisher_file, prepared.solution_dir / task.target_file)
+        
         # Run rubric evaluation if enabled
         if self.run_rubric and generated_code:
             print(f"\nPhase 3: Rubric Evaluation ({self.rubric_evaluator})")
@@ -456,14 +1671,119 @@ class BenchmarkRunner:
         # Save result
         self._save_result(result, workspace)
         
-        # Cleanup (optionally keep for debugging)
-        if verify_success:
-            shutil.rmtree(workspace)
-        else:
-            print(f"  Workspace kept for debugging: {workspace}")
+        self._cleanup_workspace(workspace, verify_success)
         
         return result
     
+    def _cleanup_workspace(self, workspace: Optional[Path], success: bool):
+        """Remove a run's workspace, or keep a failed one for debugging."""
+        if workspace is None:
+            return
+        if success:
+            shutil.rmtree(workspace, ignore_errors=True)
+        elif self.keep_failed:
+            print(f"  Workspace kept for debugging: {workspace}")
+        else:
+            if not self._failed_workspaces:
+                atexit.register(self._remove_failed_workspaces)
+            self._failed_workspaces.append(workspace)
+            print(f"  Workspace kept until exit (--keep-failed to keep it): {workspace}")
+    
+    def _verify_stage(
+        self,
+        generation: concurrent.futures.Future,
+        task_id: str,
+        model: str,
+        slot: int,
+    ) -> BenchmarkResult:
+        """Wait for a run's code generation, then verify it; frees its slot."""
+        try:
+            try:
+                prepared = generation.result()
+            except Exception as e:
+                return BenchmarkResult(
+                    task_id=task_id,
+                    model=model,
+                    success=False,
+                    reason=f"Worker failed: {e}",
+                )
+            if prepared.result is not None:
+                # Workers never clean up; failed workspaces are handled here
+                self._cleanup_workspace(prepared.workspace, success=False)
+                return prepared.result
+            return self._complete_run(prepared)
+        finally:
+            self.domains.release(slot)
+    
+    def run_matrix(
+        self,
+        tasks: list[str],
+        models: list[str],
+        workers: int = 1,
+        verify_workers: int = 1,
+    ) -> list[BenchmarkResult]:
+        """Run every (task, model) pair as a two-stage pipeline.
+        
+        Code generation (LLM-bound) runs in a pool of `workers` processes,
+        which bounds the number of in-flight LLM sessions. Verification
+        (subprocess-bound) runs on `verify_workers` threads in this process,
+        so run N is verified while run N+1 is still generating.
+        
+        Each run gets its own workspace and leased domain tag, so runs that
+        share a task's domain ID do not see each other's samples.
+        
+        Returns results in (task, model) order.
+        """
+        jobs = [(task_id, model) for task_id in tasks for model in models]
+        
+        # The runner is shipped to each worker once; jobs only carry IDs, so
+        # a worker keeps its Aider server and caches across the whole sweep
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_generation_worker,
+                        initargs=(self,),
+                    ) as generators, \
+                    concurrent.futures.ThreadPoolExecutor(max_workers=verify_workers) as verifiers:
+                futures = []
+                for task_id, model in jobs:
+                    # Blocks while every slot is held; verifiers free them
+                    slot = self.domains.acquire()
+                    generation = generators.submit(
+                        _prepare_in_worker, task_id, model, f"dds_bench_{slot}"
+                    )
+                    futures.append(verifiers.submit(
+                        self._verify_stage, generation, task_id, model, slot
+                    ))
+                results = [future.result() for future in futures]
+        finally:
+            # Keep the results of finished runs on Ctrl-C or a failed run
+            self.flush_results()
+        
+        passed = sum(1 for r in results if r.success)
+        print(f"\n{'='*60}")
+        print(f"Matrix: {passed}/{len(results)} passed")
+        for r in results:
+            status = "✓" if r.success else "✗"
+            print(f"  {status} {r.task_id:12s} | {r.model:40s} | {r.time_seconds:.1f}s")
+        
+        return results
+    
+    def _rubric_client(self):
+        """Return the shared RubricEvaluator, creating it on first use.
+        
+        One evaluator (and its HTTP client) serves every run, so a sweep
+        reuses connections instead of building a client per evaluation.
+        """
+        if self._rubric is None:
+            # rubric_evaluator.py lives next to this script
+            if str(self.benchmark_dir) not in sys.path:
+                sys.path.insert(0, str(self.benchmark_dir))
+            from rubric_evaluator import RubricEvaluator
+            
+            self._rubric = RubricEvaluator(self.rubric_evaluator)
+        return self._rubric
+    
     def _run_rubric_evaluation(
         self,
         code: str,
@@ -474,15 +1794,9 @@ class BenchmarkRunner:
         Returns RubricScores or None if evaluation fails.
         """
         try:
-            # Import from same directory
-            import sys
-            sys.path.insert(0, str(self.benchmark_dir))
-            from rubric_evaluator import RubricEvaluator
+            evaluator = self._rubric_client()
             
-            evaluator = RubricEvaluator(self.rubric_evaluator)
-            
-            with open(task.prompt_file) as f:
-                task_prompt = f.read()
+            task_prompt = _read_text(task.prompt_file)
             
             task_type = "publisher" if "publisher" in task.name.lower() else "subscriber"
             
@@ -499,17 +1813,9 @@ class BenchmarkRunner:
             scores.max_score = int(evaluation.max_overall)
             
             for s in evaluation.scores:
-                dim = s.dimension.lower().replace(" ", "_")
-                if "prompt" in dim:
-                    scores.prompt_following = s.score
-                elif "style" in dim:
-                    scores.code_style = s.score
-                elif "correct" in dim:
-                    scores.correctness = s.score
-                elif "dds" in dim or "practice" in dim:
-                    scores.dds_best_practices = s.score
-                elif "error" in dim:
-                    scores.error_handling = s.score
+                attr = _rubric_field(s.dimension)
+                if attr is not None:
+                    setattr(scores, attr, s.score)
             
             return scores
             
@@ -518,54 +1824,100 @@ class BenchmarkRunner:
                 print(f"Rubric evaluation failed: {e}", file=sys.stderr)
             return None
     
+    def _remove_failed_workspaces(self):
+        """atexit hook: delete the workspaces of failed runs."""
+        for workspace in self._failed_workspaces:
+            shutil.rmtree(workspace, ignore_errors=True)
+        self._failed_workspaces.clear()
+    
+    def flush_results(self):
+        """Write out any buffered Parquet result rows."""
+        if self._parquet_log is not None:
+            self._parquet_log.flush()
+    
     def _save_result(self, result: BenchmarkResult, workspace: Path):
         """Save benchmark result to results directory."""
+        if self._parquet_log is not None:
+            result_file = self._parquet_log.append(result)
+            if self.verbose:
+                print(f"Result buffered for: {result_file}", file=sys.stderr)
+            return
+        
         results_dir = self.benchmark_dir / "results" / result.model
         results_dir.mkdir(parents=True, exist_ok=True)
         
-        result_file = results_dir / f"{result.task_id}_{result.timestamp.replace(':', '-')}.json"
+        when = datetime.fromtimestamp(result.timestamp / 1e9)
+        timestamp = when.isoformat()
         
-        # Convert result to dict, handling Optional fields
-        result_dict = {
-            "task_id": result.task_id,
-            "model": result.model,
-            "success": result.success,
-            "reason": result.reason,
-            "time_seconds": result.time_seconds,
-            "aider_iterations": result.aider_iterations,
-            "samples_matched": result.samples_matched,
-            "samples_expected": result.samples_expected,
-            "checkpoints": result.checkpoints,
-            "error_log": result.error_log,
-            "timestamp": result.timestamp,
-            "rubric_evaluator": result.rubric_evaluator,
-        }
+        result_dict = asdict(result)
+        # The generated code isn't part of the results log
+        del result_dict["generated_code"]
+        result_dict["error_log"] = result.error_log[-ERROR_LOG_MAX_CHARS:]
+        result_dict["timestamp"] = timestamp
+        if result.rubric_scores is None:
+            del result_dict["rubric_scores"]
         
-        if result.rubric_scores:
-            result_dict["rubric_scores"] = {
-                "prompt_following": result.rubric_scores.prompt_following,
-                "code_style": result.rubric_scores.code_style,
-                "correctness": result.rubric_scores.correctness,
-                "dds_best_practices": result.rubric_scores.dds_best_practices,
-                "error_handling": result.rubric_scores.error_handling,
-                "overall": result.rubric_scores.overall,
-                "max_score": result.rubric_scores.max_score,
-                "summary": result.rubric_scores.summary,
-            }
-        
-        with open(result_file, "w") as f:
-            json.dump(result_dict, f, indent=2)
+        if self.per_run_json:
+            # Same stamp as the ISO timestamp, with '-' for ':' (Windows-safe)
+            result_file = results_dir / f"{result.task_id}_{when:%Y-%m-%dT%H-%M-%S.%f}.json"
+            if HAS_ORJSON:
+                data = orjson.dumps(result_dict, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(result_dict, indent=2).encode()
+            result_file.write_bytes(data)
+        else:
+            # One line per run, appended in a single write so concurrent
+            # workers don't interleave records
+            result_file = results_dir / "results.ndjson"
+            if HAS_ORJSON:
+                line = orjson.dumps(result_dict, option=orjson.OPT_APPEND_NEWLINE)
+            else:
+                line = (json.dumps(result_dict, separators=(",", ":")) + "\n").encode()
+            with open(result_file, "ab") as f:
+                f.write(line)
         
         if self.verbose:
             print(f"Result saved: {result_file}", file=sys.stderr)
 
 
+# Runner owned by a run_matrix generation worker process
+_worker_runner: Optional[BenchmarkRunner] = None
+
+
+def _init_generation_worker(runner: BenchmarkRunner):
+    global _worker_runner
+    _worker_runner = runner
+
+
+def _prepare_in_worker(task_id: str, model: str, domain_tag: Optional[str]) -> PreparedRun:
+    return _worker_runner._prepare_run(task_id, model, domain_tag)
+
+
+def _read_id_list(path: str) -> list[str]:
+    """One ID per line; blank lines and # comments are ignored."""
+    ids = []
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                ids.append(line)
+    return ids
+
+
 def main():
     parser = argparse.ArgumentParser(description="DDS Benchmark Runner")
-    parser.add_argument("--task", "-t", required=True,
-                        help="Task ID (e.g., L1-PY-01)")
-    parser.add_argument("--model", "-m", required=True,
-                        help="Model name (e.g., openai/gpt-5.2, anthropic/claude-opus-4-5)")
+    parser.add_argument("--task", "-t", nargs="+", default=[],
+                        help="Task ID(s) (e.g., L1-PY-01)")
+    parser.add_argument("--model", "-m", nargs="+", default=[],
+                        help="Model name(s) (e.g., openai/gpt-5.2, anthropic/claude-opus-4-5)")
+    parser.add_argument("--tasks-file",
+                        help="File with one task ID per line, added to --task")
+    parser.add_argument("--models-file",
+                        help="File with one model name per line, added to --model")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Worker processes for multi-run sweeps (default: 1)")
+    parser.add_argument("--verify-workers", type=int, default=1,
+                        help="Concurrent verifications in multi-run sweeps (default: 1)")
     parser.add_argument("--benchmark-dir", "-d", default=None,
                         help="Benchmark directory (default: auto-detect)")
     parser.add_argument("--verbose", "-v", action="store_true",
@@ -577,9 +1929,50 @@ def main():
                         help="Model to use for rubric evaluation")
     parser.add_argument("--no-iterative", action="store_true",
                         help="Disable iterative mode (single-shot only)")
+    parser.add_argument("--legacy-json", action="store_true",
+                        help="Append results to results/<model>/results.ndjson even "
+                             "when pyarrow is installed (default: results/parquet/)")
+    parser.add_argument("--per-run-json", action="store_true",
+                        help="Write one pretty-printed JSON file per run instead of "
+                             "appending to results/<model>/results.ndjson")
+    parser.add_argument("--aider-server", action="store_true",
+                        help="Reuse one in-process Aider worker across runs "
+                             "instead of launching the aider CLI per task")
+    parser.add_argument("--shmem", action="store_true",
+                        help="Restrict DDS to the shared-memory transport "
+                             "(publisher and subscriber run on this host)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always run Aider; don't read or write the solution cache")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Run Aider even if a cached solution exists, then update the cache")
+    parser.add_argument("--legacy-io", action="store_true",
+                        help="Have the subscriber write actual_output.jsonl and "
+                             "compare it with dds-sample-compare")
+    parser.add_argument("--subscriber-daemon", action="store_true",
+                        help="Keep one reference subscriber process per task alive "
+                             "across runs (tasks with verification.daemon)")
+    parser.add_argument("--no-skip-verify", action="store_true",
+                        help="Verify even code identical to an earlier passing run")
+    parser.add_argument("--workspace-root",
+                        help="Directory for run workspaces (default: $DDS_BENCH_TMP, "
+                             "else /dev/shm, else the system temp dir)")
+    parser.add_argument("--keep-failed", action="store_true",
+                        help="Keep workspaces of failed runs after exit "
+                             "(default: delete them when the runner exits)")
+    parser.add_argument("--domain-range", type=int, nargs=2, metavar=("FIRST", "LAST"),
+                        help="Slots leased for per-run domain tags "
+                             "(default: dds.domain_id_range from config.yaml)")
     
     args = parser.parse_args()
     
+    if args.tasks_file:
+        args.task += _read_id_list(args.tasks_file)
+    if args.models_file:
+        args.model += _read_id_list(args.models_file)
+    if not args.task or not args.model:
+        parser.error("at least one task (--task/--tasks-file) and one model "
+                     "(--model/--models-file) are required")
+    
     # Find benchmark directory
     if args.benchmark_dir:
         benchmark_dir = Path(args.benchmark_dir)
@@ -603,10 +1996,30 @@ def main():
         run_rubric=args.rubric,
         rubric_evaluator=args.rubric_evaluator,
         iterative=not args.no_iterative,
+        per_run_json=args.per_run_json,
+        use_aider_server=args.aider_server,
+        shmem=args.shmem,
+        domain_range=tuple(args.domain_range) if args.domain_range else None,
+        solution_cache=not args.no_cache,
+        refresh_cache=args.refresh_cache,
+        legacy_io=args.legacy_io,
+        subscriber_daemon=args.subscriber_daemon,
+        skip_verify=not args.no_skip_verify,
+        legacy_json=args.legacy_json,
+        workspace_root=args.workspace_root,
+        keep_failed=args.keep_failed,
     )
-    result = runner.run_benchmark(args.task, args.model)
     
-    sys.exit(0 if result.success else 1)
+    if len(args.task) == 1 and len(args.model) == 1 and args.workers == 1:
+        result = runner.run_benchmark(args.task[0], args.model[0])
+        sys.exit(0 if result.success else 1)
+    
+    results = runner.run_matrix(
+        args.task, args.model,
+        workers=args.workers,
+        verify_workers=args.verify_workers,
+    )
+    sys.exit(0 if all(r.success for r in results) else 1)
 
 
 if __name__ == "__main__":
@@ -21,13 +21,18 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
+import functools
 import json
 import os
+import random
 import re
 import shutil
+import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -36,6 +41,26 @@ from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from benchmark_runner import (
+    AiderServer,
+    AiderServerError,
+    copy_file,
+    isolated_env,
+    resolve_executable,
+    wait_for_ready,
+)
+from llm_cache import LLMCache, SemanticCache, cache_key
 from pricing import CostTracker, BenchmarkCostSummary, format_cost
 
 # Try to import LLM clients
@@ -53,10 +78,116 @@ except ImportError:
 
 try:
     import google.generativeai as genai
+    from google.api_core import exceptions as google_exceptions
     HAS_GOOGLE = True
 except ImportError:
     HAS_GOOGLE = False
 
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+
+# Only the start of Aider's output is shown to the driver; keep that much
+AIDER_OUTPUT_MAX_CHARS = 16 * 1024
+# One pass per Aider line: edits, files it wrote (a name not yet passed to it
+# means a new file) and its per-request usage, e.g.
+# "Tokens: 2.3k sent, 1,024 received. Cost: ..."
+AIDER_LINE_RE = re.compile(
+    r"Applied edit(?: to (?P<edited>\S+\.py))?"
+    r"|Created (?P<created>\S+\.py)"
+    r"|Tokens:\s*(?P<sent>[\d.,]+k?)(?: sent, (?P<received>[\d.,]+k?) received)?"
+)
+# Driver history: the task turn and the last few exchanges are re-sent
+# verbatim; older turns are cut down to their opening lines
+DRIVER_HISTORY_TURNS = 3
+COMPACT_MESSAGE_CHARS = 600
+# Past this many messages the compacted exchanges are dropped in one batch;
+# batching means the cached request prefix is invalidated rarely
+DRIVER_MAX_MESSAGES = 40
+
+TESTS_PASSED_RE = re.compile(r"(\d+)/(\d+) tests passed")
+
+# Driver requests in flight across all concurrent runs (run_many), and the
+# backoff for throttled or overloaded providers. The SDKs' own short retries
+# run first; these cover quota windows that last tens of seconds.
+DRIVER_MAX_CONCURRENCY = int(os.environ.get("DRIVER_MAX_CONCURRENCY", "8"))
+DRIVER_MAX_ATTEMPTS = 6
+DRIVER_BACKOFF_MAX_SECONDS = 60.0
+_driver_slots = threading.BoundedSemaphore(DRIVER_MAX_CONCURRENCY)
+
+RETRYABLE_ERRORS: tuple = ()
+if HAS_ANTHROPIC:
+    RETRYABLE_ERRORS += (
+        anthropic.RateLimitError,
+        anthropic.APIConnectionError,  # Includes timeouts
+        anthropic.InternalServerError,  # Includes 529 overloaded
+    )
+if HAS_OPENAI:
+    RETRYABLE_ERRORS += (
+        openai.RateLimitError,
+        openai.APIConnectionError,
+        openai.InternalServerError,
+    )
+if HAS_GOOGLE:
+    RETRYABLE_ERRORS += (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _tokenizer():
+    """cl100k_base encoding, or None without tiktoken or its data file."""
+    if not HAS_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None  # Encoding file not cached and no network
+
+
+def _count_tokens(text: str) -> float:
+    """Token count of text; falls back to ~1.3 tokens per word."""
+    encoding = _tokenizer()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return len(text.split()) * 1.3
+
+
+def _parse_token_count(text: str) -> int:
+    """Parse an Aider token count such as "1,024" or "2.3k"."""
+    text = text.replace(",", "")
+    if text.endswith("k"):
+        return int(float(text[:-1]) * 1000)
+    return int(float(text))
+
+
+def _kill_group(proc: subprocess.Popen):
+    """Kill proc and, on POSIX, everything in its session (start_new_session)."""
+    if os.name != "nt":
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    else:
+        proc.kill()
+
+
+@functools.lru_cache(maxsize=1)
+def _system_prompt_tokens() -> int:
+    """Token count of DRIVER_SYSTEM_PROMPT, computed once."""
+    return int(_count_tokens(DRIVER_SYSTEM_PROMPT))
+
+
+def _count_samples(path: Path) -> int:
+    """Number of non-blank lines in a JSONL file, read one line at a time."""
+    with open(path, "rb") as f:
+        return sum(1 for line in f if line.strip())
+
 
 @dataclass
 class DualAgentConfig:
@@ -69,6 +200,9 @@ class DualAgentConfig:
     timeout_seconds: int = 600
     verbose: bool = False
     dev_mode: bool = False  # Include solution.md for harness testing
+    llm_cache: bool = False  # Answer repeated driver prompts from results/.llm_cache
+    semantic_cache: bool = False  # Reuse replies to near-identical reviews of the same task (results/.sem_cache)
+    aider_server: bool = False  # Run the Coder on a persistent aider_server.py worker
 
 
 @dataclass
@@ -118,6 +252,18 @@ Communication format:
 Remember: You cannot see the code directly. The Coder will show you test results and errors.
 """
 
+# The system prompt as each provider takes it, built once and passed by
+# reference on every call; identical bytes keep the provider's prefix cache warm
+DRIVER_SYSTEM_BLOCKS = [{
+    "type": "text",
+    "text": DRIVER_SYSTEM_PROMPT,
+    "cache_control": {"type": "ephemeral"},
+}]
+DRIVER_SYSTEM_MESSAGE = {"role": "system", "content": DRIVER_SYSTEM_PROMPT}
+
+# How often to check on a Batch API job (--batch-initial)
+BATCH_POLL_SECONDS = 30
+
 DRIVER_INITIAL_PROMPT = """You are supervising a Coder who needs to complete this task:
 
 {task_prompt}
@@ -159,106 +305,221 @@ Otherwise, give specific instructions for the next attempt.
 """
 
 
+def _openai_limit(model_name: str) -> dict:
+    """Reply length limit; GPT-5+ models use max_completion_tokens, older use max_tokens."""
+    if "gpt-5" in model_name or "o1" in model_name or "o3" in model_name:
+        return {"max_completion_tokens": 2048}
+    return {"max_tokens": 2048}
+
+
+def _anthropic_messages(conversation: list) -> list:
+    """Conversation with cache breakpoints on the task turn and the newest turn.
+    
+    With the system prompt that makes three of Anthropic's four breakpoints;
+    the task turn stays stable for the whole run, even as later turns are
+    compacted, and the next call re-reads the newest turn at the cached rate.
+    """
+    messages = [dict(msg) for msg in conversation]
+    for i in {0, len(messages) - 1}:
+        messages[i]["content"] = [{
+            "type": "text",
+            "text": messages[i]["content"],
+            "cache_control": {"type": "ephemeral"},
+        }]
+    return messages
+
+
+@functools.lru_cache(maxsize=None)
+def _make_client(model: str) -> tuple:
+    """API client and provider name for a driver model.
+    
+    Clients are shared by every DriverAgent in the process (and are
+    thread-safe), so batch runs reuse their pooled HTTPS connections
+    instead of opening new ones per task.
+    """
+    # Check for OpenRouter prefix first (supports many providers)
+    if model.startswith("openrouter/"):
+        if not HAS_OPENAI:
+            raise ImportError("openai package required for OpenRouter")
+        api_key = os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            raise ValueError("OPENROUTER_API_KEY environment variable required")
+        client = openai.OpenAI(
+            base_url="https://openrouter.ai/api/v1",
+            api_key=api_key,
+        )
+        provider = "openrouter"
+    elif "anthropic" in model or "claude" in model:
+        if not HAS_ANTHROPIC:
+            raise ImportError("anthropic package required for Claude models")
+        client = anthropic.Anthropic()
+        provider = "anthropic"
+    elif "openai" in model or "gpt" in model:
+        if not HAS_OPENAI:
+            raise ImportError("openai package required for GPT models")
+        client = openai.OpenAI()
+        provider = "openai"
+    elif "gemini" in model:
+        if not HAS_GOOGLE:
+            raise ImportError("google.generativeai package required for Gemini")
+        # Check both GOOGLE_API_KEY and GEMINI_API_KEY
+        api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY environment variable required")
+        genai.configure(api_key=api_key)
+        client = genai.GenerativeModel(model, system_instruction=DRIVER_SYSTEM_PROMPT)
+        provider = "google"
+    else:
+        raise ValueError(f"Unknown model provider: {model}")
+    return client, provider
+
+
 class DriverAgent:
     """The supervisory agent that guides the Coder."""
     
-    def __init__(self, model: str, verbose: bool = False):
+    def __init__(
+        self,
+        model: str,
+        verbose: bool = False,
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        initial_reply: Optional[dict] = None,
+    ):
         self.model = model
         self.verbose = verbose
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.initial_reply = initial_reply  # Precomputed by a Batch API job
+        self.cache_hits = 0
         self.conversation = []
+        self._compacted = 2  # conversation[:2] (task turn) is never compacted
         self.total_tokens_used = 0  # Track cumulative token usage
         self.cost_tracker = CostTracker(model)  # Track costs
         self._setup_client()
     
     def _setup_client(self):
         """Setup the appropriate API client."""
-        # Check for OpenRouter prefix first (supports many providers)
-        if self.model.startswith("openrouter/"):
-            if not HAS_OPENAI:
-                raise ImportError("openai package required for OpenRouter")
-            api_key = os.environ.get("OPENROUTER_API_KEY")
-            if not api_key:
-                raise ValueError("OPENROUTER_API_KEY environment variable required")
-            self.client = openai.OpenAI(
-                base_url="https://openrouter.ai/api/v1",
-                api_key=api_key,
-            )
-            self.provider = "openrouter"
-        elif "anthropic" in self.model or "claude" in self.model:
-            if not HAS_ANTHROPIC:
-                raise ImportError("anthropic package required for Claude models")
-            self.client = anthropic.Anthropic()
-            self.provider = "anthropic"
-        elif "openai" in self.model or "gpt" in self.model:
-            if not HAS_OPENAI:
-                raise ImportError("openai package required for GPT models")
-            self.client = openai.OpenAI()
-            self.provider = "openai"
-        elif "gemini" in self.model:
-            if not HAS_GOOGLE:
-                raise ImportError("google.generativeai package required for Gemini")
-            # Check both GOOGLE_API_KEY and GEMINI_API_KEY
-            api_key = os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
-            if not api_key:
-                raise ValueError("GOOGLE_API_KEY or GEMINI_API_KEY environment variable required")
-            genai.configure(api_key=api_key)
-            self.client = genai.GenerativeModel(self.model)
-            self.provider = "google"
-        else:
-            raise ValueError(f"Unknown model provider: {self.model}")
+        self.client, self.provider = _make_client(self.model)
+    
+    def _compact_history(self):
+        """Trim turns that have fallen out of the recent window.
+        
+        Each old review prompt repeats the full code and test output, so
+        resending them makes input tokens grow quadratically over a run.
+        A message is compacted once, when it leaves the window, so the
+        request prefix stays stable for provider prompt caching. Once the
+        history reaches DRIVER_MAX_MESSAGES, all compacted exchanges are
+        dropped together, leaving the task turn and the recent window.
+        """
+        # Exclude the pending user prompt and the last full exchanges
+        end = len(self.conversation) - 1 - 2 * DRIVER_HISTORY_TURNS
+        for msg in self.conversation[self._compacted:max(end, self._compacted)]:
+            if len(msg["content"]) > COMPACT_MESSAGE_CHARS:
+                msg["content"] = (
+                    msg["content"][:COMPACT_MESSAGE_CHARS]
+                    + "\n[... trimmed; superseded by later turns ...]"
+                )
+        self._compacted = max(end, self._compacted)
+        
+        if len(self.conversation) > DRIVER_MAX_MESSAGES:
+            # conversation[2:_compacted] is whole user/assistant exchanges
+            del self.conversation[2:self._compacted]
+            self._compacted = 2
     
     def _call_llm(self, prompt: str) -> str:
         """Call the driver model."""
         self.conversation.append({"role": "user", "content": prompt})
-        tokens_used = 0
+        self._compact_history()
+        
+        key = None
+        if self.cache is not None:
+            key = cache_key(self.model, DRIVER_SYSTEM_PROMPT, self.conversation)
+            cached = self.cache.get(key)
+            if cached is not None:
+                # No request was made, so nothing is billed
+                self.cache_hits += 1
+                self.cost_tracker.add_usage(0, 0)
+                reply = cached["reply"]
+                self.conversation.append({"role": "assistant", "content": reply})
+                if self.verbose:
+                    print(f"\n[DRIVER] (cached) {reply[:500]}...", file=sys.stderr)
+                return reply
+        
+        for attempt in range(DRIVER_MAX_ATTEMPTS):
+            try:
+                with _driver_slots:
+                    reply, input_tokens, output_tokens = self._send(prompt)
+                break
+            except RETRYABLE_ERRORS as e:
+                if attempt == DRIVER_MAX_ATTEMPTS - 1:
+                    raise
+                # Full jitter so throttled runs don't retry in lockstep
+                delay = random.uniform(0, min(DRIVER_BACKOFF_MAX_SECONDS, 2 ** (attempt + 1)))
+                if self.verbose:
+                    print(f"[DRIVER] {type(e).__name__}; retrying in {delay:.1f}s", file=sys.stderr)
+                time.sleep(delay)
+        tokens_used = input_tokens + output_tokens
+        
+        self.total_tokens_used += tokens_used
+        self.conversation.append({"role": "assistant", "content": reply})
+        
+        if key is not None:
+            self.cache.set(key, {
+                "reply": reply,
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+            })
+        
+        if self.verbose:
+            print(f"\n[DRIVER] ({tokens_used} tokens) {reply[:500]}...", file=sys.stderr)
+        
+        return reply
+    
+    def _send(self, prompt: str) -> tuple[str, int, int]:
+        """Make one provider request; returns (reply, input_tokens, output_tokens)."""
+        input_tokens = output_tokens = 0
         
         if self.provider == "anthropic":
             model_name = self.model.replace("anthropic/", "")
             response = self.client.messages.create(
                 model=model_name,
                 max_tokens=2048,
-                system=DRIVER_SYSTEM_PROMPT,
-                messages=self.conversation,
+                system=DRIVER_SYSTEM_BLOCKS,
+                messages=_anthropic_messages(self.conversation),
             )
             reply = response.content[0].text
-            # Track tokens and cost
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            tokens_used = input_tokens + output_tokens
-            self.cost_tracker.add_usage(input_tokens, output_tokens)
+            # Track tokens and cost; cached prefix tokens are billed at the
+            # cache rates but still count toward the token budget
+            usage = response.usage
+            cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+            cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+            input_tokens = usage.input_tokens + cache_write + cache_read
+            output_tokens = usage.output_tokens
+            self.cost_tracker.add_usage(
+                usage.input_tokens, output_tokens, cache_write, cache_read
+            )
             
         elif self.provider == "openai":
             model_name = self.model.replace("openai/", "")
-            messages = [{"role": "system", "content": DRIVER_SYSTEM_PROMPT}]
-            messages.extend(self.conversation)
+            messages = [DRIVER_SYSTEM_MESSAGE, *self.conversation]
             
-            # GPT-5+ models use max_completion_tokens, older use max_tokens
-            if "gpt-5" in model_name or "o1" in model_name or "o3" in model_name:
-                response = self.client.chat.completions.create(
-                    model=model_name,
-                    max_completion_tokens=2048,
-                    messages=messages,
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model=model_name,
-                    max_tokens=2048,
-                    messages=messages,
-                )
+            response = self.client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                **_openai_limit(model_name),
+            )
             reply = response.choices[0].message.content
             # Track tokens and cost
             if response.usage:
                 input_tokens = response.usage.prompt_tokens
                 output_tokens = response.usage.completion_tokens
-                tokens_used = input_tokens + output_tokens
                 self.cost_tracker.add_usage(input_tokens, output_tokens)
                 
         elif self.provider == "openrouter":
             # OpenRouter uses OpenAI-compatible API
             # Model format: openrouter/provider/model (e.g., openrouter/xai/grok-2)
             model_name = self.model.replace("openrouter/", "")
-            messages = [{"role": "system", "content": DRIVER_SYSTEM_PROMPT}]
-            messages.extend(self.conversation)
+            messages = [DRIVER_SYSTEM_MESSAGE, *self.conversation]
             
             response = self.client.chat.completions.create(
                 model=model_name,
@@ -270,32 +531,44 @@ class DriverAgent:
             if response.usage:
                 input_tokens = response.usage.prompt_tokens
                 output_tokens = response.usage.completion_tokens
-                tokens_used = input_tokens + output_tokens
                 self.cost_tracker.add_usage(input_tokens, output_tokens)
                 
         elif self.provider == "google":
-            # Gemini uses a different format
-            full_prompt = f"{DRIVER_SYSTEM_PROMPT}\n\n{prompt}"
-            response = self.client.generate_content(full_prompt)
+            # Gemini takes the system prompt on the model (see _make_client)
+            response = self.client.generate_content(prompt)
             reply = response.text
-            # Estimate tokens for Google (rough: 1.3 tokens per word)
-            input_tokens = int(len(full_prompt.split()) * 1.3)
-            output_tokens = int(len(reply.split()) * 1.3)
-            tokens_used = input_tokens + output_tokens
+            # Gemini reports usage on the response; estimate only if absent
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None and usage.prompt_token_count:
+                input_tokens = usage.prompt_token_count
+                output_tokens = usage.candidates_token_count or 0
+            else:
+                input_tokens = _system_prompt_tokens() + int(_count_tokens(prompt))
+                output_tokens = int(_count_tokens(reply))
             self.cost_tracker.add_usage(input_tokens, output_tokens)
         
-        self.total_tokens_used += tokens_used
-        self.conversation.append({"role": "assistant", "content": reply})
-        
-        if self.verbose:
-            print(f"\n[DRIVER] ({tokens_used} tokens) {reply[:500]}...", file=sys.stderr)
-        
-        return reply
+        return reply, input_tokens, output_tokens
     
     def get_initial_instructions(self, task_prompt: str) -> str:
         """Get initial instructions for the Coder."""
         prompt = DRIVER_INITIAL_PROMPT.format(task_prompt=task_prompt)
-        return self._call_llm(prompt)
+        entry = self.initial_reply
+        if entry is None:
+            return self._call_llm(prompt)
+        
+        # Answered ahead of time by precompute_initial_instructions
+        self.conversation.append({"role": "user", "content": prompt})
+        self.conversation.append({"role": "assistant", "content": entry["reply"]})
+        self.cost_tracker.add_usage(
+            entry["input_tokens"], entry["output_tokens"],
+            entry.get("cache_write_tokens", 0), entry.get("cache_read_tokens", 0),
+            batch=True,
+        )
+        self.total_tokens_used += (
+            entry["input_tokens"] + entry["output_tokens"]
+            + entry.get("cache_write_tokens", 0) + entry.get("cache_read_tokens", 0)
+        )
+        return entry["reply"]
     
     def review_and_guide(
         self, 
@@ -313,73 +586,131 @@ class DriverAgent:
             current_code=current_code or "(no code yet)",
         )
         
+        query = None
+        if self.semantic_cache is not None:
+            query = self.semantic_cache.embed(
+                f"{coder_actions}\n{test_results}\n{current_code}"
+            )
+            cached = self.semantic_cache.get(query)
+            if cached is not None:
+                self.cache_hits += 1
+                self.cost_tracker.add_usage(0, 0)
+                self.conversation.append({"role": "user", "content": prompt})
+                self.conversation.append({"role": "assistant", "content": cached})
+                if self.verbose:
+                    print(f"\n[DRIVER] (similar review cached) {cached[:500]}...", file=sys.stderr)
+                return cached, False
+        
         response = self._call_llm(prompt)
         is_complete = "TASK_COMPLETE" in response.upper()
         
+        # Never replay a completion verdict: a near-identical payload can
+        # still differ in the one test that failed
+        if query is not None and not is_complete:
+            self.semantic_cache.set(query, response)
+        
         return response, is_complete
 
 
+class _AiderScan:
+    """Bookkeeping over Aider's output, fed one line at a time.
+    
+    Keeps the output, counts edits, notes files Aider wrote that it wasn't
+    given, and sums its "Tokens:" reports. Only when there were none is the
+    output itself tokenized, in one call to count_tokens().
+    """
+    
+    def __init__(self, known_files: list[str]):
+        self.known_files = known_files
+        self.lines = []
+        self.edits = 0
+        self.new_files = False
+        self.tokens_sent: Optional[int] = None  # None: Aider reported no usage
+        self.tokens_received = 0
+    
+    def feed(self, line: str):
+        self.lines.append(line)
+        match = AIDER_LINE_RE.search(line)
+        if match is None:
+            return
+        if match.group("sent") is not None:
+            self.tokens_sent = (self.tokens_sent or 0) + _parse_token_count(match.group("sent"))
+            if match.group("received") is not None:
+                self.tokens_received += _parse_token_count(match.group("received"))
+            return
+        if match.group("created") is None:
+            self.edits += 1
+        wrote = match.group("edited") or match.group("created")
+        if wrote is not None and wrote not in self.known_files:
+            self.new_files = True
+    
+    @property
+    def output(self) -> str:
+        return "".join(self.lines)[:AIDER_OUTPUT_MAX_CHARS]
+    
+    def count_tokens(self) -> int:
+        """Token count of the whole output, for when Aider reported none."""
+        return int(_count_tokens("".join(self.lines)))
+
+
 class CoderAgent:
     """The coding agent that uses Aider."""
     
-    def __init__(self, model: str, workspace: Path, verbose: bool = False):
+    def __init__(
+        self,
+        model: str,
+        workspace: Path,
+        verbose: bool = False,
+        env: Optional[dict] = None,
+        server: Optional[AiderServer] = None,
+    ):
         self.model = model
         self.workspace = workspace
         self.verbose = verbose
+        self.env = env  # Environment for Aider and test runs (None: inherit)
+        self.server = server  # Persistent Aider worker (None: spawn the CLI)
         self.edit_count = 0
         self.estimated_tokens = 0  # Rough estimate based on Aider output
         self.cost_tracker = CostTracker(model)  # Track costs
+        self._test_script: Optional[Path] = None
+        self._refresh_py_files()
+    
+    def _refresh_py_files(self):
+        """Rescan the workspace for the (non-test) files Aider may edit."""
+        self._py_files = sorted(
+            f.name for f in self.workspace.glob("*.py")
+            if not f.name.startswith("test_")
+        )
     
     def execute_instructions(self, instructions: str, timeout: int = 120) -> tuple[str, str]:
         """Execute instructions using Aider.
         
         Returns: (aider_output, test_results)
         """
-        # Find Python files in workspace to add to Aider
-        py_files = list(self.workspace.glob("*.py"))
-        # Exclude test files
-        py_files = [f for f in py_files if not f.name.startswith("test_")]
-        
-        cmd = [
-            "aider",
-            "--model", self.model,
-            "--yes",
-            "--no-git",
-            "--no-pretty",
-            "--message", instructions,
-        ]
-        
-        # Add Python files for Aider to edit
-        for f in py_files:
-            cmd.append(str(f.name))
-        
         if self.verbose:
             print(f"\n[CODER] Running Aider with: {instructions[:200]}...", file=sys.stderr)
         
+        scan = _AiderScan(self._py_files)
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.workspace,
-                timeout=timeout,
-                capture_output=True,
-                text=True,
-            )
-            aider_output = result.stdout + result.stderr
+            if self.server is None or not self._run_aider_server(instructions, timeout, scan):
+                self._run_aider_cli(instructions, timeout, scan)
             
-            # Count edits
-            self.edit_count += aider_output.count("Applied edit")
+            if scan.new_files:
+                self._refresh_py_files()
             
-            # Estimate tokens (Aider may print "Tokens:" in output)
-            token_match = re.search(r"Tokens:\s*([\d,]+)", aider_output)
-            if token_match:
-                tokens_this_call = int(token_match.group(1).replace(",", ""))
+            aider_output = scan.output
+            self.edit_count += scan.edits
+            
+            # Prefer Aider's own "Tokens:" reports; otherwise count its output
+            if scan.tokens_sent is not None:
+                tokens_this_call = scan.tokens_sent + scan.tokens_received
+                self.cost_tracker.add_usage(scan.tokens_sent, scan.tokens_received)
             else:
-                # Rough estimate: ~1.3 tokens per word
-                tokens_this_call = int(len(aider_output.split()) * 1.3)
+                tokens_this_call = scan.count_tokens()
+                # Estimate cost (assume 70% input, 30% output for Aider)
+                self.cost_tracker.add_total_tokens(tokens_this_call, input_ratio=0.7)
             
             self.estimated_tokens += tokens_this_call
-            # Estimate cost (assume 70% input, 30% output for Aider)
-            self.cost_tracker.add_total_tokens(tokens_this_call, input_ratio=0.7)
             
         except subprocess.TimeoutExpired:
             aider_output = "Aider timed out"
@@ -391,9 +722,135 @@ class CoderAgent:
         
         return aider_output, test_results
     
+    def _run_aider_cli(self, instructions: str, timeout: int, scan: "_AiderScan"):
+        """Run the aider CLI once, feeding its output to scan as it arrives."""
+        # Add Python files for Aider to edit; the list is rescanned only
+        # when Aider writes a file it wasn't given
+        cmd = [
+            resolve_executable("aider"),
+            "--model", self.model,
+            "--yes",
+            "--no-git",
+            "--no-pretty",
+            "--message", instructions,
+            *self._py_files,
+        ]
+        
+        proc = subprocess.Popen(
+            cmd,
+            cwd=self.workspace,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=self.env,
+            start_new_session=(os.name != "nt"),
+        )
+        timed_out = threading.Event()
+        
+        def expire():
+            # Kill the whole group; a test run Aider started would
+            # otherwise hold the pipe open
+            timed_out.set()
+            _kill_group(proc)
+        
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                scan.feed(line)
+            proc.wait()
+        finally:
+            timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    def _run_aider_server(self, instructions: str, timeout: int, scan: "_AiderScan") -> bool:
+        """Run the instructions on the persistent Aider worker.
+        
+        Returns False if the worker crashed so the caller can spawn the CLI.
+        """
+        # Only ship variables that differ from the worker's environment
+        env_delta = {}
+        if self.env:
+            env_delta = {k: v for k, v in self.env.items() if os.environ.get(k) != v}
+        
+        payload = {
+            "workspace": str(self.workspace),
+            "model": self.model,
+            "prompt": instructions,
+            "test_cmd": None,
+            "env": env_delta,
+            "fnames": self._py_files,
+        }
+        try:
+            response = self.server.request(payload, timeout, threading.Event())
+        except AiderServerError as e:
+            print(f"  {e}; falling back to aider CLI", file=sys.stderr)
+            return False
+        
+        if response is None:
+            raise subprocess.TimeoutExpired("aider_server", timeout)
+        if not response["success"]:
+            raise RuntimeError(response["output"])
+        for line in response["output"].splitlines(keepends=True):
+            scan.feed(line)
+        return True
+    
     def _run_test(self) -> str:
         """Run the test script."""
-        # Find the appropriate test script - look for any test_*.py
+        # Test scripts are copied in at setup and never edited; find once
+        if self._test_script is None:
+            self._test_script = self._find_test_script()
+        test_script = self._test_script
+        
+        if test_script is None:
+            return "No test script available"
+        
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, str(test_script)],
+                cwd=self.workspace,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                env=self.env,
+                start_new_session=(os.name != "nt"),
+            )
+            timed_out = threading.Event()
+            
+            def expire():
+                timed_out.set()
+                _kill_group(proc)
+            
+            timer = threading.Timer(90, expire)  # Increased for subscriber tests
+            timer.start()
+            
+            # Stop as soon as the script reports success instead of waiting
+            # for its teardown; killing the group also takes down the
+            # publisher/subscriber processes it started
+            lines = []
+            try:
+                for line in proc.stdout:
+                    lines.append(line)
+                    if "ALL TESTS PASSED" in line:
+                        _kill_group(proc)
+                        lines.extend(proc.stdout)  # Whatever was already buffered
+                        break
+                proc.wait()
+            finally:
+                timer.cancel()
+            
+            if timed_out.is_set():
+                return "Test timed out"
+            return "".join(lines)
+        except Exception as e:
+            return f"Test error: {e}"
+    
+    def _find_test_script(self) -> Optional[Path]:
+        """Find the appropriate test script - look for any test_*.py."""
         test_script = None
         
         # First try specific names in priority order
@@ -410,22 +867,7 @@ class CoderAgent:
                 test_script = candidate
                 break
         
-        if test_script is None:
-            return "No test script available"
-        
-        try:
-            result = subprocess.run(
-                [sys.executable, str(test_script)],
-                cwd=self.workspace,
-                timeout=90,  # Increased for subscriber tests
-                capture_output=True,
-                text=True,
-            )
-            return result.stdout + result.stderr
-        except subprocess.TimeoutExpired:
-            return "Test timed out"
-        except Exception as e:
-            return f"Test error: {e}"
+        return test_script
     
     def get_current_code(self) -> str:
         """Get the current code (publisher or subscriber)."""
@@ -444,53 +886,110 @@ class DualAgentBenchmark:
         self.benchmark_dir = benchmark_dir
         self.verbose = verbose
         self.config = self._load_config()
+        self._encoder = None  # Embedding model for --semantic-cache, loaded once
+        # One SemanticCache per cache file, shared by concurrent runs
+        self._semantic_caches: dict[Path, SemanticCache] = {}
+        self._semantic_caches_lock = threading.Lock()
+        # Persistent Aider workers (--aider-server): one per concurrent run,
+        # handed back to the idle list when the run's iterations finish
+        self._aider_servers: list[AiderServer] = []
+        self._idle_aider_servers: list[AiderServer] = []
+        self._aider_servers_lock = threading.Lock()
+        # Initial driver replies from precompute_initial_instructions,
+        # keyed by (driver model, initial prompt)
+        self._initial_replies: dict[tuple[str, str], dict] = {}
+    
+    def _semantic_cache(self, path: Path) -> SemanticCache:
+        """Return the shared SemanticCache for path, loading it on first use."""
+        with self._semantic_caches_lock:
+            cache = self._semantic_caches.get(path)
+            if cache is None:
+                if self._encoder is None:
+                    self._encoder = SemanticCache.load_encoder()
+                cache = SemanticCache(path, self._encoder)
+                self._semantic_caches[path] = cache
+            return cache
+    
+    def _acquire_aider_server(self) -> AiderServer:
+        """An idle Aider worker, or a new one (started on its first request)."""
+        with self._aider_servers_lock:
+            if self._idle_aider_servers:
+                return self._idle_aider_servers.pop()
+            server = AiderServer(
+                Path(__file__).with_name("aider_server.py"), verbose=self.verbose
+            )
+            self._aider_servers.append(server)
+            return server
+    
+    def _release_aider_server(self, server: AiderServer):
+        with self._aider_servers_lock:
+            self._idle_aider_servers.append(server)
+    
+    def close(self):
+        """Stop any persistent Aider workers."""
+        with self._aider_servers_lock:
+            for server in self._aider_servers:
+                server.close()
+            self._aider_servers.clear()
+            self._idle_aider_servers.clear()
     
     def _load_config(self) -> dict:
         """Load benchmark configuration."""
         config_path = self.benchmark_dir / "config.yaml"
         with open(config_path) as f:
-            return yaml.safe_load(f)
+            return yaml.load(f.read(), Loader=SafeLoader)
     
     def _setup_workspace(self, task_dir: Path) -> Path:
-        """Create isolated workspace."""
+        """Create isolated workspace.
+        
+        Failed workspaces are kept for inspection, so this is a plain
+        mkdtemp; run() removes it on success. Files are copied with
+        copy_file, which shares extents (reflink) where the filesystem can.
+        """
         workspace = Path(tempfile.mkdtemp(prefix="dds_dual_"))
         
         # Copy all test scripts (test_publisher.py, test_subscriber.py, test_*.py)
         for test_script in task_dir.glob("test_*.py"):
-            shutil.copy(test_script, workspace)
+            copy_file(test_script, workspace / test_script.name)
         
         # Copy any shell scripts
         for script in task_dir.glob("*.sh"):
-            shutil.copy(script, workspace)
+            copy_file(script, workspace / script.name)
         
         # Copy reference directory
         ref_dir = task_dir / "reference"
         if ref_dir.exists():
-            shutil.copytree(ref_dir, workspace / "reference")
+            shutil.copytree(ref_dir, workspace / "reference", copy_function=copy_file)
             # Also copy essential protocol/utility files to workspace root for test access
             for proto_file in ref_dir.glob("protocol*.py"):
-                shutil.copy(proto_file, workspace)
+                copy_file(proto_file, workspace / proto_file.name)
         
         # Copy broken directory for debugging tasks (LQ-)
         broken_dir = task_dir / "broken"
         if broken_dir.exists():
             # For QoS tasks, copy broken files as starting point
             for f in broken_dir.glob("*.py"):
-                shutil.copy(f, workspace)
+                copy_file(f, workspace / f.name)
         
         # Copy starter files if present
         starter_dir = task_dir / "starter"
         if starter_dir.exists():
             for f in starter_dir.glob("*"):
-                shutil.copy(f, workspace)
+                if f.is_file():
+                    copy_file(f, workspace / f.name)
         
         if self.verbose:
             print(f"Workspace: {workspace}", file=sys.stderr)
         
         return workspace
     
-    def run(self, config: DualAgentConfig) -> DualAgentResult:
-        """Run the dual-agent benchmark."""
+    def run(self, config: DualAgentConfig, domain_tag: Optional[str] = None) -> DualAgentResult:
+        """Run the dual-agent benchmark.
+        
+        With a domain_tag, every DDS participant the run starts (Aider's
+        tests, verification) joins that tag, isolating it from concurrent
+        runs on the same domain ID.
+        """
         print(f"\n{'='*60}")
         print(f"Dual-Agent Benchmark: {config.task_id}")
         print(f"Driver: {config.driver_model}")
@@ -502,100 +1001,117 @@ class DualAgentBenchmark:
         
         # Load task
         task_dir = self._find_task_dir(config.task_id)
-        prompt_file = task_dir / "prompt.md"
-        task_prompt = prompt_file.read_text()
-        
-        # Setup
-        workspace = self._setup_workspace(task_dir)
-        driver = DriverAgent(config.driver_model, config.verbose)
-        coder = CoderAgent(config.coder_model, workspace, config.verbose)
-        
-        # DEV MODE: Append solution for harness testing
-        solution_content = ""
+        task_prompt, solution_content = self._task_prompt(config, task_dir)
         if config.dev_mode:
-            solution_file = task_dir / "solution.md"
-            if solution_file.exists():
-                solution_content = solution_file.read_text()
-                task_prompt += "\n\n---\n\n# SOLUTION (DEV MODE)\n\n"
-                task_prompt += solution_content
+            if solution_content:
                 print("[DEV MODE] Solution appended to prompt")
             else:
                 print("[DEV MODE] Warning: No solution.md found")
         
-        # Get initial instructions from Driver
-        print("\n[Driver] Providing initial instructions...")
-        instructions = driver.get_initial_instructions(task_prompt)
-        
-        # DEV MODE: Append solution code to coder's first instruction
-        if config.dev_mode and solution_content:
-            instructions += f"\n\n---\n\nHere is the complete solution code to create:\n\n{solution_content}"
-        conversation_log.append({
-            "turn": 0,
-            "role": "driver",
-            "content": instructions,
-        })
-        
-        # Iteration loop
-        is_complete = False
-        iteration = 0
-        
-        while iteration < config.max_iterations and not is_complete:
-            iteration += 1
-            print(f"\n[Iteration {iteration}/{config.max_iterations}]")
-            
-            # Coder executes instructions
-            print(f"  [Coder] Executing...")
-            aider_output, test_results = coder.execute_instructions(instructions)
-            current_code = coder.get_current_code()
-            
-            conversation_log.append({
-                "turn": iteration,
-                "role": "coder",
-                "aider_output": aider_output[:1000],
-                "test_results": test_results,
-            })
-            
-            # Check if test passed
-            if "ALL TESTS PASSED" in test_results:
-                print(f"  [Test] ✓ PASSED")
-                is_complete = True
-                break
-            else:
-                # Extract error info
-                print(f"  [Test] ✗ Failed")
-                if config.verbose:
-                    print(f"    {test_results[:300]}")
-            
-            # Driver reviews and guides
-            print(f"  [Driver] Reviewing...")
-            instructions, is_complete = driver.review_and_guide(
-                coder_actions=aider_output[:1000],
-                test_results=test_results,
-                current_code=current_code,
+        # Setup
+        workspace = self._setup_workspace(task_dir)
+        env = isolated_env(workspace, domain_tag) if domain_tag else None
+        cache = None
+        if config.llm_cache:
+            cache = LLMCache(self.benchmark_dir / "results" / ".llm_cache")
+        semantic_cache = None
+        if config.semantic_cache:
+            # Scoped to the task: a review for one task must never be
+            # replayed as guidance for another
+            semantic_cache = self._semantic_cache(
+                self.benchmark_dir / "results" / ".sem_cache"
+                / config.driver_model.replace('/', '_') / f"{config.task_id}.npz"
             )
+        initial_reply = self._initial_replies.get((
+            config.driver_model, DRIVER_INITIAL_PROMPT.format(task_prompt=task_prompt)
+        ))
+        driver = DriverAgent(
+            config.driver_model, config.verbose, cache, semantic_cache, initial_reply
+        )
+        server = None
+        if config.aider_server and os.name != "nt":
+            server = self._acquire_aider_server()
+        # The worker goes back to the pool even if an agent raises
+        try:
+            coder = CoderAgent(config.coder_model, workspace, config.verbose, env, server)
+            
+            # Get initial instructions from Driver
+            print("\n[Driver] Providing initial instructions...")
+            instructions = driver.get_initial_instructions(task_prompt)
             
+            # DEV MODE: Append solution code to coder's first instruction
+            if config.dev_mode and solution_content:
+                instructions += f"\n\n---\n\nHere is the complete solution code to create:\n\n{solution_content}"
             conversation_log.append({
-                "turn": iteration,
+                "turn": 0,
                 "role": "driver",
-                "content": instructions[:1000],
-                "marked_complete": is_complete,
+                "content": instructions,
             })
             
-            # Check timeout
-            if time.time() - start_time > config.timeout_seconds:
-                print("\n⚠ Timeout reached")
-                break
+            # Iteration loop
+            is_complete = False
+            iteration = 0
             
-            # Check token limit
-            if driver.total_tokens_used > config.max_tokens:
-                print(f"\n⚠ Token limit reached ({driver.total_tokens_used:,}/{config.max_tokens:,})")
-                break
+            while iteration < config.max_iterations and not is_complete:
+                iteration += 1
+                print(f"\n[Iteration {iteration}/{config.max_iterations}]")
+                
+                # Coder executes instructions
+                print(f"  [Coder] Executing...")
+                aider_output, test_results = coder.execute_instructions(instructions)
+                current_code = coder.get_current_code()
+                
+                conversation_log.append({
+                    "turn": iteration,
+                    "role": "coder",
+                    "aider_output": aider_output[:1000],
+                    "test_results": test_results,
+                })
+                
+                # Check if test passed
+                if "ALL TESTS PASSED" in test_results:
+                    print(f"  [Test] ✓ PASSED")
+                    is_complete = True
+                    break
+                else:
+                    # Extract error info
+                    print(f"  [Test] ✗ Failed")
+                    if config.verbose:
+                        print(f"    {test_results[:300]}")
+                
+                # Driver reviews and guides
+                print(f"  [Driver] Reviewing...")
+                instructions, is_complete = driver.review_and_guide(
+                    coder_actions=aider_output[:1000],
+                    test_results=test_results,
+                    current_code=current_code,
+                )
+                
+                conversation_log.append({
+                    "turn": iteration,
+                    "role": "driver",
+                    "content": instructions[:1000],
+                    "marked_complete": is_complete,
+                })
+                
+                # Check timeout
+                if time.time() - start_time > config.timeout_seconds:
+                    print("\n⚠ Timeout reached")
+                    break
+                
+                # Check token limit
+                if driver.total_tokens_used > config.max_tokens:
+                    print(f"\n⚠ Token limit reached ({driver.total_tokens_used:,}/{config.max_tokens:,})")
+                    break
+        finally:
+            if server is not None:
+                self._release_aider_server(server)
         
         elapsed = time.time() - start_time
         
         # Final verification
         print("\n[Final Verification]")
-        success, matched, expected = self._verify(workspace, task_dir)
+        success, matched, expected = self._verify(workspace, task_dir, env)
         
         # Calculate token usage and costs
         driver_tokens = driver.total_tokens_used
@@ -650,6 +1166,131 @@ class DualAgentBenchmark:
         
         return result
     
+    def _task_prompt(self, config: DualAgentConfig, task_dir: Path) -> tuple[str, str]:
+        """The task prompt for a run and, in dev mode, the solution it includes."""
+        task_prompt = (task_dir / "prompt.md").read_text()
+        
+        # DEV MODE: Append solution for harness testing
+        solution_content = ""
+        if config.dev_mode:
+            solution_file = task_dir / "solution.md"
+            if solution_file.exists():
+                solution_content = solution_file.read_text()
+                task_prompt += "\n\n---\n\n# SOLUTION (DEV MODE)\n\n"
+                task_prompt += solution_content
+        return task_prompt, solution_content
+    
+    def precompute_initial_instructions(self, configs: list[DualAgentConfig]):
+        """Answer every run's first driver prompt through a provider Batch API.
+        
+        The initial prompt depends only on the task and driver model, so a
+        sweep can submit them all up front at the batch discount; run() then
+        starts each driver from the stored reply. Anthropic and OpenAI
+        drivers are batched (one job per model); others, and any request
+        the job fails, are answered live as usual. Blocks until the jobs end.
+        """
+        prompts: dict[str, set[str]] = {}
+        for config in configs:
+            task_dir = self._find_task_dir(config.task_id)
+            task_prompt, _ = self._task_prompt(config, task_dir)
+            prompts.setdefault(config.driver_model, set()).add(
+                DRIVER_INITIAL_PROMPT.format(task_prompt=task_prompt)
+            )
+        
+        for model, model_prompts in prompts.items():
+            client, provider = _make_client(model)
+            custom_ids = {f"init-{i}": prompt for i, prompt in enumerate(sorted(model_prompts))}
+            if provider == "anthropic":
+                replies = self._batch_anthropic(client, model, custom_ids)
+            elif provider == "openai":
+                replies = self._batch_openai(client, model, custom_ids)
+            else:
+                print(f"[Batch] {model}: no batch API support; initial prompts run live")
+                continue
+            for custom_id, entry in replies.items():
+                self._initial_replies[(model, custom_ids[custom_id])] = entry
+            print(f"[Batch] {model}: {len(replies)}/{len(custom_ids)} initial prompts answered")
+    
+    def _batch_anthropic(self, client, model: str, custom_ids: dict[str, str]) -> dict[str, dict]:
+        """Run prompts as one Message Batch; returns entries by custom_id."""
+        batch = client.messages.batches.create(requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model.replace("anthropic/", ""),
+                    "max_tokens": 2048,
+                    "system": DRIVER_SYSTEM_BLOCKS,
+                    "messages": _anthropic_messages([{"role": "user", "content": prompt}]),
+                },
+            }
+            for custom_id, prompt in custom_ids.items()
+        ])
+        print(f"[Batch] {model}: submitted {batch.id}")
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = client.messages.batches.retrieve(batch.id)
+        
+        replies = {}
+        for result in client.messages.batches.results(batch.id):
+            if result.result.type != "succeeded":
+                continue
+            message = result.result.message
+            usage = message.usage
+            replies[result.custom_id] = {
+                "reply": message.content[0].text,
+                "input_tokens": usage.input_tokens,
+                "output_tokens": usage.output_tokens,
+                "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+                "cache_read_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            }
+        return replies
+    
+    def _batch_openai(self, client, model: str, custom_ids: dict[str, str]) -> dict[str, dict]:
+        """Run prompts as one Batch API job; returns entries by custom_id."""
+        model_name = model.replace("openai/", "")
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model_name,
+                    "messages": [DRIVER_SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                    **_openai_limit(model_name),
+                },
+            })
+            for custom_id, prompt in custom_ids.items()
+        ]
+        input_file = client.files.create(
+            file=("initial_instructions.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        print(f"[Batch] {model}: submitted {batch.id}")
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = client.batches.retrieve(batch.id)
+        
+        replies = {}
+        if not batch.output_file_id:
+            return replies
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            body = response["body"]
+            replies[record["custom_id"]] = {
+                "reply": body["choices"][0]["message"]["content"],
+                "input_tokens": body["usage"]["prompt_tokens"],
+                "output_tokens": body["usage"]["completion_tokens"],
+            }
+        return replies
+    
     def _find_task_dir(self, task_id: str) -> Path:
         """Find task directory."""
         tasks_dir = self.benchmark_dir / "tasks"
@@ -658,7 +1299,42 @@ class DualAgentBenchmark:
                 return d
         raise ValueError(f"Task {task_id} not found")
     
-    def _verify(self, workspace: Path, task_dir: Path) -> tuple[bool, int, int]:
+    def run_many(self, configs: list[DualAgentConfig], workers: int = 1) -> list[DualAgentResult]:
+        """Run several benchmarks, up to `workers` at a time.
+        
+        A run spends most of its time waiting on LLM responses and child
+        processes, so threads overlap them well. Each run gets its own
+        domain tag. Returns results in config order.
+        """
+        if workers <= 1:
+            return [self.run(config) for config in configs]
+        
+        if any(config.semantic_cache for config in configs) and self._encoder is None:
+            # Load once up front rather than racing to load it per thread
+            self._encoder = SemanticCache.load_encoder()
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self.run, config, f"dds_dual_{os.getpid()}_{i}")
+                for i, config in enumerate(configs)
+            ]
+            return [future.result() for future in futures]
+    
+    def _ready_signal(self, task_dir: Path) -> bool:
+        """Whether the task's reference subscriber supports --ready."""
+        task_file = task_dir / "task.yaml"
+        if not task_file.exists():
+            return False
+        with open(task_file) as f:
+            task = yaml.load(f.read(), Loader=SafeLoader) or {}
+        return bool(task.get("verification", {}).get("ready_signal", False))
+    
+    def _verify(
+        self,
+        workspace: Path,
+        task_dir: Path,
+        env: Optional[dict] = None,
+    ) -> tuple[bool, int, int]:
         """Run final verification with proper process management."""
         publisher = workspace / "publisher.py"
         subscriber = workspace / "subscriber.py"
@@ -683,12 +1359,12 @@ class DualAgentBenchmark:
                     timeout=120,
                     capture_output=True,
                     text=True,
+                    env=env,
                 )
                 if "ALL TESTS PASSED" in result.stdout:
                     return True, 10, 10
                 # Check for specific pass counts like "5/5" or "6/6"
-                import re
-                match = re.search(r"(\d+)/(\d+) tests passed", result.stdout)
+                match = TESTS_PASSED_RE.search(result.stdout)
                 if match and match.group(1) == match.group(2):
                     return True, 10, 10
                 return False, 0, 10
@@ -704,16 +1380,33 @@ class DualAgentBenchmark:
                     return False, 0, 10
                 
                 # Start reference subscriber FIRST
-                output_handle = open(output_file, "w")
-                sub_proc = subprocess.Popen(
-                    [sys.executable, str(ref_subscriber),
-                     "--domain", "85", "--count", "10", "--timeout", "30"],
-                    stdout=output_handle,
-                    stderr=subprocess.PIPE,
-                )
-                
-                # Wait for subscriber to be ready
-                time.sleep(3)
+                sub_cmd = [sys.executable, str(ref_subscriber),
+                           "--domain", "85", "--count", "10", "--timeout", "30"]
+                if self._ready_signal(task_dir) and os.name != "nt":
+                    # Samples go to the file; stdout only carries READY,
+                    # so the publisher starts as soon as the reader exists
+                    sub_proc = subprocess.Popen(
+                        sub_cmd + ["--output", str(output_file), "--ready"],
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        env=env,
+                    )
+                    if not wait_for_ready(sub_proc, timeout=10.0):
+                        if self.verbose:
+                            print("Reference subscriber did not become ready", file=sys.stderr)
+                        return False, 0, 10
+                else:
+                    output_handle = open(output_file, "w")
+                    sub_proc = subprocess.Popen(
+                        sub_cmd,
+                        stdout=output_handle,
+                        stderr=subprocess.PIPE,
+                        env=env,
+                    )
+                    
+                    # Wait for subscriber to be ready
+                    time.sleep(3)
                 
                 # Run generated publisher
                 pub_result = subprocess.run(
@@ -721,12 +1414,11 @@ class DualAgentBenchmark:
                     cwd=workspace,
                     timeout=60,
                     capture_output=True,
+                    env=env,
                 )
                 
-                # Wait for subscriber to finish receiving
-                time.sleep(3)
-                
-                # Give subscriber time to complete
+                # The subscriber exits once it has all samples; give it
+                # time to complete
                 try:
                     sub_proc.wait(timeout=20)
                 except subprocess.TimeoutExpired:
@@ -747,9 +1439,11 @@ class DualAgentBenchmark:
                     stdout=output_handle,
                     stderr=subprocess.PIPE,
                     cwd=workspace,
+                    env=env,
                 )
                 
-                # Wait for subscriber to be ready (discovery)
+                # Generated subscribers have no READY signal; allow time
+                # for discovery
                 time.sleep(3)
                 
                 # Run reference publisher
@@ -759,12 +1453,11 @@ class DualAgentBenchmark:
                     cwd=task_dir / "reference",
                     timeout=60,
                     capture_output=True,
+                    env=env,
                 )
                 
-                # Wait for reliable delivery
-                time.sleep(3)
-                
-                # Give subscriber time to complete
+                # The subscriber exits once it has all samples; give it
+                # time to complete
                 try:
                     sub_proc.wait(timeout=20)
                 except subprocess.TimeoutExpired:
@@ -786,26 +1479,16 @@ class DualAgentBenchmark:
             if sub_proc and sub_proc.poll() is None:
                 sub_proc.kill()
         
-        # Compare output
+        # Compare output; without an expected file, 10 samples are required
         try:
-            if output_file.exists():
-                actual_lines = output_file.read_text().strip().split("\n")
-                actual_count = len([l for l in actual_lines if l.strip()])
-                
-                if expected_output.exists():
-                    expected_lines = expected_output.read_text().strip().split("\n")
-                    expected_count = len([l for l in expected_lines if l.strip()])
-                    
-                    if actual_count >= expected_count:
-                        return True, actual_count, expected_count
-                    return False, actual_count, expected_count
-                else:
-                    # No expected file, just check we got samples
-                    if actual_count >= 10:
-                        return True, actual_count, 10
-                    return False, actual_count, 10
+            if not output_file.exists():
+                return False, 0, 10
             
-            return False, 0, 10
+            actual_count = _count_samples(output_file)
+            expected_count = (
+                _count_samples(expected_output) if expected_output.exists() else 10
+            )
+            return actual_count >= expected_count, actual_count, expected_count
             
         except Exception as e:
             if self.verbose:
@@ -820,35 +1503,41 @@ class DualAgentBenchmark:
         filename = f"{result.task_id}_{result.driver_model.replace('/', '_')}__{result.coder_model.replace('/', '_')}_{result.timestamp.replace(':', '-')}.json"
         result_file = results_dir / filename
         
-        with open(result_file, "w") as f:
-            json.dump({
-                "task_id": result.task_id,
-                "driver_model": result.driver_model,
-                "coder_model": result.coder_model,
-                "success": result.success,
-                "reason": result.reason,
-                "total_iterations": result.total_iterations,
-                "driver_turns": result.driver_turns,
-                "coder_edits": result.coder_edits,
-                "driver_tokens": result.driver_tokens,
-                "coder_tokens": result.coder_tokens,
-                "total_tokens": result.total_tokens,
-                "driver_cost_usd": result.driver_cost_usd,
-                "coder_cost_usd": result.coder_cost_usd,
-                "total_cost_usd": result.total_cost_usd,
-                "time_seconds": result.time_seconds,
-                "samples_matched": result.samples_matched,
-                "samples_expected": result.samples_expected,
-                "timestamp": result.timestamp,
-                "conversation_log": result.conversation_log,
-            }, f, indent=2)
+        # Listed explicitly rather than asdict(), which would deep-copy the
+        # conversation log; generated_code is not saved
+        result_dict = {
+            "task_id": result.task_id,
+            "driver_model": result.driver_model,
+            "coder_model": result.coder_model,
+            "success": result.success,
+            "reason": result.reason,
+            "total_iterations": result.total_iterations,
+            "driver_turns": result.driver_turns,
+            "coder_edits": result.coder_edits,
+            "driver_tokens": result.driver_tokens,
+            "coder_tokens": result.coder_tokens,
+            "total_tokens": result.total_tokens,
+            "driver_cost_usd": result.driver_cost_usd,
+            "coder_cost_usd": result.coder_cost_usd,
+            "total_cost_usd": result.total_cost_usd,
+            "time_seconds": result.time_seconds,
+            "samples_matched": result.samples_matched,
+            "samples_expected": result.samples_expected,
+            "timestamp": result.timestamp,
+            "conversation_log": result.conversation_log,
+        }
+        if HAS_ORJSON:
+            data = orjson.dumps(result_dict, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(result_dict, indent=2).encode()
+        result_file.write_bytes(data)
         
         print(f"Result saved: {result_file}")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Dual-Agent DDS Benchmark")
-    parser.add_argument("--task", "-t", required=True, help="Task ID")
+    parser.add_argument("--task", "-t", required=True, nargs="+", help="Task ID(s)")
     parser.add_argument("--driver", "-d", required=True,
                         help="Driver model (heavy reasoning model)")
     parser.add_argument("--coder", "-c", required=True,
@@ -862,6 +1551,20 @@ def main():
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument("--dev-mode", action="store_true",
                         help="Development mode: include solution.md in prompt (for testing harness)")
+    parser.add_argument("--llm-cache", action="store_true",
+                        help="Reuse driver replies for identical prompts from "
+                             "results/.llm_cache (no API cost on a hit)")
+    parser.add_argument("--semantic-cache", action="store_true",
+                        help="Reuse the driver's reply to a near-identical earlier review of the same task "
+                             "(needs sentence-transformers)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Tasks to run concurrently (default: 1)")
+    parser.add_argument("--batch-initial", action="store_true",
+                        help="Answer every task's first driver prompt up front through the "
+                             "provider Batch API (half price; waits for the job to finish)")
+    parser.add_argument("--aider-server", action="store_true",
+                        help="Keep Aider loaded in a persistent worker (aider_server.py) "
+                             "instead of starting the CLI every iteration")
     parser.add_argument("--benchmark-dir", "-b", default=None)
     
     args = parser.parse_args()
@@ -878,22 +1581,32 @@ def main():
             print("ERROR: Could not find benchmark directory", file=sys.stderr)
             sys.exit(1)
     
-    config = DualAgentConfig(
-        task_id=args.task,
-        driver_model=args.driver,
-        coder_model=args.coder,
-        max_iterations=args.max_iterations,
-        max_tokens=args.max_tokens,
-        timeout_seconds=args.timeout,
-        verbose=args.verbose,
-        dev_mode=args.dev_mode,
-    )
+    configs = [
+        DualAgentConfig(
+            task_id=task_id,
+            driver_model=args.driver,
+            coder_model=args.coder,
+            max_iterations=args.max_iterations,
+            max_tokens=args.max_tokens,
+            timeout_seconds=args.timeout,
+            verbose=args.verbose,
+            dev_mode=args.dev_mode,
+            llm_cache=args.llm_cache,
+            semantic_cache=args.semantic_cache,
+            aider_server=args.aider_server,
+        )
+        for task_id in args.task
+    ]
     
     benchmark = DualAgentBenchmark(benchmark_dir, args.verbose)
-    result = benchmark.run(config)
+    try:
+        if args.batch_initial:
+            benchmark.precompute_initial_instructions(configs)
+        results = benchmark.run_many(configs, workers=args.workers)
+    finally:
+        benchmark.close()
     
-    sys.exit(0 if result.success else 1)
-
+    sys.exit(0 if all(r.success for r in results) else 1)
 
 if __name__ == "__main__":
     main()
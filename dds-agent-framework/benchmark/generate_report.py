@@ -14,6 +14,9 @@ Usage:
     # Generate from specific result file
     python generate_report.py --input results/suites/suite_results_20260101.json
     
+    # Generate from a JSONL file of results (one result object per line)
+    python generate_report.py --input results.jsonl
+    
     # Generate HTML report
     python generate_report.py --html
     
@@ -22,25 +25,52 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from html import escape
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-# Try to import visualization libraries
 try:
-    import matplotlib
-    matplotlib.use('Agg')  # Non-interactive backend
-    import matplotlib.pyplot as plt
-    HAS_MATPLOTLIB = True
+    import ijson
+    HAS_IJSON = True
 except ImportError:
-    HAS_MATPLOTLIB = False
+    HAS_IJSON = False
+
+# Result files larger than this are streamed with ijson instead of loaded
+STREAM_MIN_BYTES = 50 << 20
+# Read buffer for streamed result files (the io default is 8 KiB)
+STREAM_BUFFER_BYTES = 1 << 20
+# zlib level for non-publication PNGs: encoding dominates chart render time
+# and level 1 is several times faster than the default for a slightly
+# larger file
+DRAFT_PNG_COMPRESS_LEVEL = 1
+# Charts are rasterized and encoded in parallel; Agg and Pillow's PNG
+# encoder release the GIL
+PNG_SAVE_WORKERS = 4
+# Pass-rate bars are labelled only for up to this many models
+BAR_LABEL_MAX_MODELS = 100
+
+
+@functools.lru_cache(maxsize=None)
+def short_name(model: str) -> str:
+    """Model name without its provider prefix; one split per distinct model."""
+    return model.rsplit('/', 1)[-1]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResult:
     """Aggregated results for a single model."""
     model: str
@@ -51,162 +81,375 @@ class ModelResult:
     total_tokens: int
     avg_time: float
     cost_per_pass: float  # Cost efficiency
+    
+    @property
+    def short_model(self) -> str:
+        """Model name without its provider prefix."""
+        return short_name(self.model)
+
+
+class ResultRow(NamedTuple):
+    """The fields of one suite result that the reports display."""
+    task: str
+    model: str
+    short_model: str  # Without the provider prefix
+    success: bool
+    cost: float
+    tokens: int
+    time: float
+
+
+def result_rows(data: dict) -> list[ResultRow]:
+    """Extract the reported fields of every result in one pass.
+    
+    The report sections walk the results several times; doing the lookups
+    once also means a ResultStream is parsed once.
+    """
+    rows = []
+    for r in data.get("results", []):
+        model = r.get("model", "unknown")
+        rows.append(ResultRow(
+            task=r.get("task", "unknown"),
+            model=model,
+            short_model=short_name(model),
+            success=bool(r.get("success")),
+            cost=r.get("cost", 0),
+            tokens=r.get("tokens", 0),
+            time=r.get("time", 0),
+        ))
+    return rows
+
+
+class ResultStream:
+    """The results of a suite file, parsed lazily on each iteration.
+    
+    Stands in for the list in `data["results"]` for files too large to load.
+    Iterating holds one parsed result at a time; the reports read it once,
+    through result_rows, so memory grows with the compact ResultRow tuples
+    rather than the file's parsed JSON. A .jsonl file holds one result per
+    line; otherwise the "results" array is read with ijson.
+    """
+    
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+    
+    def __iter__(self):
+        with open(self.filepath, "rb", buffering=STREAM_BUFFER_BYTES) as f:
+            if self.filepath.suffix == ".jsonl":
+                loads = orjson.loads if HAS_ORJSON else json.loads
+                for line in f:
+                    if line.strip():
+                        yield loads(line)
+            else:
+                yield from ijson.items(
+                    f, "results.item", use_float=True, buf_size=STREAM_BUFFER_BYTES
+                )
+
+
+def _load_summary(filepath: Path) -> dict:
+    """Top-level scalar fields of a suite file, without building its results.
+    
+    run_all_benchmarks writes the summary ahead of "results", so parsing
+    stops where the array starts instead of tokenizing the whole file.
+    """
+    data = {}
+    with open(filepath, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "results" and event == "start_array":
+                break
+            if "." not in prefix and event in ("string", "number", "boolean", "null"):
+                data[prefix] = value
+    return data
+
+
+def summarize_rows(rows: list[ResultRow]) -> dict:
+    """Suite summary fields, for result files that do not carry them."""
+    total = len(rows)
+    passed = tokens = 0
+    cost = time_s = 0.0
+    for row in rows:
+        passed += row.success
+        cost += row.cost
+        tokens += row.tokens
+        time_s += row.time
+    return {
+        "total_time_seconds": time_s,
+        "total_tasks": total,
+        "passed": passed,
+        "failed": total - passed,
+        "pass_rate": f"{100 * passed / max(1, total):.1f}%",
+        "total_cost_usd": round(cost, 4),
+        "total_tokens": tokens,
+    }
 
 
 def load_results(filepath: Path) -> dict:
-    """Load results from JSON file."""
-    with open(filepath) as f:
+    """Load results from a JSON suite file or a JSONL file of results.
+    
+    Files over STREAM_MIN_BYTES are streamed when ijson is installed: the
+    summary fields are loaded and "results" is a ResultStream. JSONL files
+    are always streamed line by line; they have no summary fields, which
+    summarize_rows can fill in.
+    """
+    filepath = Path(filepath)
+    if filepath.suffix == ".jsonl":
+        return {"results": ResultStream(filepath)}
+    if HAS_IJSON and filepath.stat().st_size > STREAM_MIN_BYTES:
+        data = _load_summary(filepath)
+        data["results"] = ResultStream(filepath)
+        return data
+    # Whole-file loads are one read(); binary mode skips the text decoder
+    if HAS_ORJSON:
+        return orjson.loads(filepath.read_bytes())
+    with open(filepath, "rb") as f:
         return json.load(f)
 
 
 def find_latest_results(results_dir: Path) -> Optional[Path]:
-    """Find the most recent results file."""
+    """Find the most recent results file.
+    
+    run_all_benchmarks names suites suite_results_YYYYMMDD_HHMMSS.json, so
+    the newest is the lexically largest name and no file needs a stat().
+    Only hand-named suites fall back to modification time.
+    """
     if not results_dir.exists():
         return None
     
-    files = sorted(
+    latest = max(results_dir.glob("suite_results_[0-9]*_[0-9]*.json"), default=None)
+    if latest is not None:
+        return latest
+    return max(
         results_dir.glob("suite_results_*.json"),
         key=lambda f: f.stat().st_mtime,
-        reverse=True,
+        default=None,
     )
-    return files[0] if files else None
 
 
-def aggregate_by_model(data: dict) -> list[ModelResult]:
-    """Aggregate results by model."""
+def _sum_by_model(rows: list[ResultRow]) -> dict:
+    """Per-model [tasks_run, tasks_passed, total_cost, total_tokens, total_time].
+    
+    A list indexed by position keeps the per-row work to one dict lookup.
+    The rows are Python tuples, so this loop beats NumPy: extracting them
+    into column arrays already costs more than summing them here.
+    """
     model_stats = {}
     
-    for result in data.get("results", []):
-        model = result.get("model", "unknown")
-        
-        if model not in model_stats:
-            model_stats[model] = {
-                "tasks_run": 0,
-                "tasks_passed": 0,
-                "total_cost": 0.0,
-                "total_tokens": 0,
-                "total_time": 0.0,
-            }
+    for row in rows:
+        stats = model_stats.get(row.model)
+        if stats is None:
+            stats = model_stats[row.model] = [0, 0, 0.0, 0, 0.0]
         
-        stats = model_stats[model]
-        stats["tasks_run"] += 1
-        if result.get("success"):
-            stats["tasks_passed"] += 1
-        stats["total_cost"] += result.get("cost", 0.0)
-        stats["total_time"] += result.get("time", 0.0)
+        stats[0] += 1
+        if row.success:
+            stats[1] += 1
+        stats[2] += row.cost
+        stats[3] += row.tokens
+        stats[4] += row.time
+    
+    return model_stats
+
+
+def aggregate_by_model(rows: list[ResultRow]) -> list[ModelResult]:
+    """Aggregate result rows by model, best pass rate first.
+    
+    Every report section relies on this order; none re-sorts by pass rate.
+    """
+    model_stats = _sum_by_model(rows)
     
     results = []
-    for model, stats in model_stats.items():
-        pass_rate = stats["tasks_passed"] / max(1, stats["tasks_run"])
-        cost_per_pass = (
-            stats["total_cost"] / stats["tasks_passed"]
-            if stats["tasks_passed"] > 0 else float('inf')
-        )
+    for model, (tasks_run, tasks_passed, total_cost, total_tokens, total_time) in model_stats.items():
+        pass_rate = tasks_passed / max(1, tasks_run)
+        cost_per_pass = total_cost / tasks_passed if tasks_passed > 0 else float('inf')
         
         results.append(ModelResult(
             model=model,
-            tasks_run=stats["tasks_run"],
-            tasks_passed=stats["tasks_passed"],
+            tasks_run=tasks_run,
+            tasks_passed=tasks_passed,
             pass_rate=pass_rate,
-            total_cost=stats["total_cost"],
-            total_tokens=stats.get("total_tokens", 0),
-            avg_time=stats["total_time"] / max(1, stats["tasks_run"]),
+            total_cost=total_cost,
+            total_tokens=total_tokens,
+            avg_time=total_time / max(1, tasks_run),
             cost_per_pass=cost_per_pass,
         ))
     
-    return sorted(results, key=lambda r: r.pass_rate, reverse=True)
+    return sorted(results, key=attrgetter('pass_rate'), reverse=True)
+
+
+# Color palette for publication, shared by the PNG and inline SVG charts
+CHART_COLORS = {
+    'success': '#27ae60',  # Green
+    'warning': '#f39c12',  # Orange
+    'failure': '#e74c3c',  # Red
+    'primary': '#3498db',  # Blue
+    'secondary': '#9b59b6',  # Purple
+}
+
+
+def tier_color(pass_rate: float) -> str:
+    """Performance-tier color for a pass rate (0-1)."""
+    if pass_rate >= 0.8:
+        return CHART_COLORS['success']
+    if pass_rate >= 0.5:
+        return CHART_COLORS['warning']
+    return CHART_COLORS['failure']
+
+
+@functools.lru_cache(maxsize=1)
+def _matplotlib():
+    """The matplotlib module, or None if not installed.
+
+    Imported on first use: terminal-only reports skip matplotlib's startup
+    cost entirely. pyplot is never imported; charts are drawn on Agg
+    canvases directly, without pyplot's global figure registry.
+    """
+    try:
+        import matplotlib
+        import matplotlib.style
+    except ImportError:
+        return None
+    return matplotlib
+
+
+def _task_grid(rows: list[ResultRow]) -> tuple[dict, list[str], list[str]]:
+    """Heatmap cells in one pass over the rows.
+    
+    Returns the first outcome per (short model, task), 1 pass and 0 fail,
+    with the sorted model and task labels of the grid.
+    """
+    outcomes = {}
+    models = set()
+    tasks = set()
+    for r in rows:
+        model = r.short_model[:20]
+        key = (model, r.task)
+        if key not in outcomes:
+            outcomes[key] = 1 if r.success else 0
+            models.add(model)
+            tasks.add(r.task)
+    return outcomes, sorted(models), sorted(tasks)
+
+
+# Per-row templates, bound once so each table row is a single format call
+_TERMINAL_ROW = "  {:<15} {:<25} {:<8} {:>8} {:>8}".format
+_HTML_RESULT_ROW = """
+        <tr class="{}">
+            <td>{}</td>
+            <td>{}</td>
+            <td>{}</td>
+            <td>${:.4f}</td>
+            <td>{:.1f}s</td>
+        </tr>""".format
+_HTML_MODEL_ROW = """
+        <tr>
+            <td>{}</td>
+            <td>{}/{}</td>
+            <td>{:.1f}%</td>
+            <td>${:.4f}</td>
+            <td>{:.1f}s</td>
+        </tr>""".format
 
 
-def print_terminal_report(data: dict, model_results: list[ModelResult]):
-    """Print a nice terminal report with ASCII charts."""
+def print_terminal_report(data: dict, model_results: list[ModelResult],
+                          rows: Optional[list[ResultRow]] = None):
+    """Print a nice terminal report with ASCII charts.
     
-    print("\n" + "═" * 80)
-    print("  DDS AGENT BENCHMARK REPORT")
-    print("═" * 80)
+    Lines are collected and written in one go; large task tables render
+    far faster than with a print() per row.
+    """
+    out = []
+    emit = out.append
+    
+    emit("\n" + "═" * 80)
+    emit("  DDS AGENT BENCHMARK REPORT")
+    emit("═" * 80)
     
     # Summary
-    print(f"\n📊 SUMMARY")
-    print("─" * 40)
-    print(f"  Total Tasks:     {data.get('total_tasks', 0)}")
-    print(f"  Passed:          {data.get('passed', 0)} ({data.get('pass_rate', '0%')})")
-    print(f"  Failed:          {data.get('failed', 0)}")
-    print(f"  Total Cost:      ${data.get('total_cost_usd', 0):.4f}")
-    print(f"  Total Tokens:    {data.get('total_tokens', 0):,}")
-    print(f"  Total Time:      {data.get('total_time_seconds', 0):.1f}s")
-    print(f"  Dev Mode:        {data.get('dev_mode', False)}")
+    emit(f"\n📊 SUMMARY")
+    emit("─" * 40)
+    emit(f"  Total Tasks:     {data.get('total_tasks', 0)}")
+    emit(f"  Passed:          {data.get('passed', 0)} ({data.get('pass_rate', '0%')})")
+    emit(f"  Failed:          {data.get('failed', 0)}")
+    emit(f"  Total Cost:      ${data.get('total_cost_usd', 0):.4f}")
+    emit(f"  Total Tokens:    {data.get('total_tokens', 0):,}")
+    emit(f"  Total Time:      {data.get('total_time_seconds', 0):.1f}s")
+    emit(f"  Dev Mode:        {data.get('dev_mode', False)}")
     
     # Model Performance Chart (ASCII bar chart)
-    print(f"\n📈 MODEL PERFORMANCE (Pass Rate)")
-    print("─" * 60)
+    emit(f"\n📈 MODEL PERFORMANCE (Pass Rate)")
+    emit("─" * 60)
     
-    max_name_len = max(len(r.model.split('/')[-1][:20]) for r in model_results) if model_results else 10
+    max_name_len = max(len(r.short_model[:20]) for r in model_results) if model_results else 10
     
     for r in model_results:
-        name = r.model.split('/')[-1][:20]
+        name = r.short_model[:20]
         bar_len = int(r.pass_rate * 30)
         bar = "█" * bar_len + "░" * (30 - bar_len)
         pct = f"{r.pass_rate * 100:.0f}%"
-        print(f"  {name:<{max_name_len}} │{bar}│ {pct:>4} ({r.tasks_passed}/{r.tasks_run})")
+        emit(f"  {name:<{max_name_len}} │{bar}│ {pct:>4} ({r.tasks_passed}/{r.tasks_run})")
     
     # Cost Efficiency Chart
-    print(f"\n💰 COST EFFICIENCY (Cost per Passed Task)")
-    print("─" * 60)
+    emit(f"\n💰 COST EFFICIENCY (Cost per Passed Task)")
+    emit("─" * 60)
     
     # Filter out infinite costs
     valid_costs = [r for r in model_results if r.cost_per_pass < float('inf')]
     if valid_costs:
         max_cost = max(r.cost_per_pass for r in valid_costs)
         for r in valid_costs:
-            name = r.model.split('/')[-1][:20]
+            name = r.short_model[:20]
             bar_len = int((r.cost_per_pass / max(max_cost, 0.001)) * 30)
             bar = "█" * bar_len + "░" * (30 - bar_len)
-            print(f"  {name:<{max_name_len}} │{bar}│ ${r.cost_per_pass:.4f}")
+            emit(f"  {name:<{max_name_len}} │{bar}│ ${r.cost_per_pass:.4f}")
     
     # Failed Tasks
-    failed = [r for r in data.get("results", []) if not r.get("success")]
+    if rows is None:
+        rows = result_rows(data)
+    failed = [r for r in rows if not r.success]
     if failed:
-        print(f"\n❌ FAILED TASKS")
-        print("─" * 60)
+        emit(f"\n❌ FAILED TASKS")
+        emit("─" * 60)
         for r in failed:
-            task = r.get("task", "unknown")
-            model = r.get("model", "unknown").split('/')[-1][:30]
-            print(f"  • {task}: {model}")
+            emit(f"  • {r.task}: {r.short_model[:30]}")
     
     # Task Details Table
-    print(f"\n📋 TASK DETAILS")
-    print("─" * 80)
-    print(f"  {'Task':<15} {'Model':<25} {'Status':<8} {'Cost':>8} {'Time':>8}")
-    print("─" * 80)
-    
-    for r in data.get("results", []):
-        task = r.get("task", "unknown")[:15]
-        model = r.get("model", "unknown").split('/')[-1][:25]
-        status = "✓ PASS" if r.get("success") else "✗ FAIL"
-        cost = f"${r.get('cost', 0):.4f}"
-        time_s = f"{r.get('time', 0):.1f}s"
-        print(f"  {task:<15} {model:<25} {status:<8} {cost:>8} {time_s:>8}")
+    emit(f"\n📋 TASK DETAILS")
+    emit("─" * 80)
+    emit(_TERMINAL_ROW("Task", "Model", "Status", "Cost", "Time"))
+    emit("─" * 80)
+    
+    for r in rows:
+        emit(_TERMINAL_ROW(
+            r.task[:15], r.short_model[:25], "✓ PASS" if r.success else "✗ FAIL",
+            f"${r.cost:.4f}", f"{r.time:.1f}s",
+        ))
     
-    print("\n" + "═" * 80)
+    emit("\n" + "═" * 80)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def generate_png_charts(data: dict, model_results: list[ModelResult], output_dir: Path,
-                        publication_quality: bool = False):
+                        publication_quality: bool = False,
+                        rows: Optional[list[ResultRow]] = None):
     """Generate PNG chart files.
     
     Args:
         publication_quality: If True, generates high-res charts suitable for papers
     """
-    if not HAS_MATPLOTLIB:
+    mpl = _matplotlib()
+    if mpl is None:
         print("⚠ matplotlib not installed, skipping PNG generation")
         print("  Install with: pip install matplotlib")
         return []
+    import numpy as np  # Always installed with matplotlib
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
     
     output_dir.mkdir(parents=True, exist_ok=True)
     generated = []
     
     # Publication-quality settings
     if publication_quality:
-        plt.rcParams.update({
+        mpl.rcParams.update({
             'font.size': 14,
             'axes.titlesize': 16,
             'axes.labelsize': 14,
@@ -221,63 +464,67 @@ def generate_png_charts(data: dict, model_results: list[ModelResult], output_dir
         dpi = 300
     else:
         dpi = 150
+    pil_kwargs = None if publication_quality else {'compress_level': DRAFT_PNG_COMPRESS_LEVEL}
+    
+    def subplots(figsize):
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        return fig, fig.add_subplot()
+    
+    # Each figure is laid out here and handed to the pool for savefig;
+    # figures share no state, so they can render concurrently
+    pool = ThreadPoolExecutor(max_workers=PNG_SAVE_WORKERS)
+    saves = []
+    
+    def save(fig, name: str, dpi: int = dpi, **kwargs):
+        filepath = output_dir / name
+        saves.append(pool.submit(
+            fig.savefig, filepath, dpi=dpi, pil_kwargs=pil_kwargs, **kwargs
+        ))
+        generated.append(filepath)
     
     # Use a clean style
-    plt.style.use('seaborn-v0_8-whitegrid')
-    
-    # Color palette for publication
-    COLORS = {
-        'success': '#27ae60',  # Green
-        'warning': '#f39c12',  # Orange  
-        'failure': '#e74c3c',  # Red
-        'primary': '#3498db',  # Blue
-        'secondary': '#9b59b6',  # Purple
-    }
+    mpl.style.use('seaborn-v0_8-whitegrid')
+    
+    # Per-model labels and values shared by the charts, best first
+    names = [r.short_model for r in model_results]
+    pass_pcts = [r.pass_rate * 100 for r in model_results]
+    colors = [tier_color(r.pass_rate) for r in model_results]
     
     # 1. Pass Rate Bar Chart (Horizontal)
-    fig, ax = plt.subplots(figsize=(12, max(4, len(model_results) * 0.8)))
-    
-    # Sort by pass rate for better visualization
-    sorted_results = sorted(model_results, key=lambda r: r.pass_rate)
-    models = [r.model.split('/')[-1] for r in sorted_results]
-    pass_rates = [r.pass_rate * 100 for r in sorted_results]
-    
-    # Color by performance tier
-    colors = [
-        COLORS['success'] if r >= 80 else 
-        COLORS['warning'] if r >= 50 else 
-        COLORS['failure'] 
-        for r in pass_rates
-    ]
+    fig, ax = subplots(figsize=(12, max(4, len(model_results) * 0.8)))
     
-    bars = ax.barh(models, pass_rates, color=colors, edgecolor='white', linewidth=0.5)
+    # barh draws bottom-up: reverse the best-first order to put the best on top
+    sorted_results = model_results[::-1]
+    pass_rates = pass_pcts[::-1]
+    
+    bars = ax.barh(names[::-1], pass_rates, color=colors[::-1], edgecolor='white', linewidth=0.5)
     ax.set_xlabel('Pass Rate (%)', fontweight='bold')
     ax.set_title('Model Performance Comparison', fontweight='bold', pad=20)
     ax.set_xlim(0, 105)
     
-    # Add value labels with task counts
-    for i, (bar, rate, result) in enumerate(zip(bars, pass_rates, sorted_results)):
-        label = f'{rate:.0f}% ({result.tasks_passed}/{result.tasks_run})'
-        ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                label, va='center', fontsize=10)
+    # Add value labels with task counts; past BAR_LABEL_MAX_MODELS they
+    # would overlap anyway
+    if len(model_results) <= BAR_LABEL_MAX_MODELS:
+        ax.bar_label(bars, labels=[
+            f'{rate:.0f}% ({result.tasks_passed}/{result.tasks_run})'
+            for rate, result in zip(pass_rates, sorted_results)
+        ], padding=3, fontsize=10)
     
     # Add gridlines
     ax.xaxis.grid(True, linestyle='--', alpha=0.7)
     ax.set_axisbelow(True)
     
-    plt.tight_layout()
-    filepath = output_dir / "pass_rate_chart.png"
-    plt.savefig(filepath, dpi=dpi, facecolor='white', edgecolor='none')
-    plt.close()
-    generated.append(filepath)
+    fig.tight_layout()
+    save(fig, "pass_rate_chart.png", facecolor='white', edgecolor='none')
     
     # 2. Cost vs Performance Scatter (Publication Quality)
     if len(model_results) > 0:
-        fig, ax = plt.subplots(figsize=(12, 8))
+        fig, ax = subplots(figsize=(12, 8))
         
         costs = [r.total_cost for r in model_results]
-        pass_rates = [r.pass_rate * 100 for r in model_results]
-        labels = [r.model.split('/')[-1] for r in model_results]
+        pass_rates = pass_pcts
+        labels = names
         sizes = [max(100, r.tasks_run * 50) for r in model_results]  # Size by tasks run
         
         scatter = ax.scatter(costs, pass_rates, s=sizes, c=pass_rates, 
@@ -312,26 +559,23 @@ def generate_png_charts(data: dict, model_results: list[ModelResult], output_dir
             ax.text(min(costs) + max(costs) * 0.05, 95, 'Low Cost\nHigh Performance', 
                    ha='left', va='top', fontsize=9, color='green', fontweight='bold')
         
-        cbar = plt.colorbar(scatter, label='Pass Rate %', shrink=0.8)
+        cbar = fig.colorbar(scatter, ax=ax, label='Pass Rate %', shrink=0.8)
         cbar.ax.tick_params(labelsize=10)
         
         ax.grid(True, linestyle='--', alpha=0.3)
-        plt.tight_layout()
-        filepath = output_dir / "cost_vs_performance.png"
-        plt.savefig(filepath, dpi=dpi, facecolor='white', edgecolor='none')
-        plt.close()
-        generated.append(filepath)
+        fig.tight_layout()
+        save(fig, "cost_vs_performance.png", facecolor='white', edgecolor='none')
     
     # 3. Cost Breakdown Pie Chart (only if multiple models with costs)
     models_with_cost = [r for r in model_results if r.total_cost > 0]
     if len(models_with_cost) > 1:
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = subplots(figsize=(10, 8))
         
         costs = [r.total_cost for r in models_with_cost]
-        labels = [r.model.split('/')[-1] for r in models_with_cost]
+        labels = [r.short_model for r in models_with_cost]
         
         # Color by model family
-        colors = plt.cm.Set3(range(len(costs)))
+        colors = mpl.colormaps['Set3'](range(len(costs)))
         
         wedges, texts, autotexts = ax.pie(
             costs, labels=labels, autopct='$%.3f', startangle=90,
@@ -351,94 +595,184 @@ def generate_png_charts(data: dict, model_results: list[ModelResult], output_dir
         ax.text(0, 0, f'Total\n${total:.3f}', ha='center', va='center', 
                 fontsize=14, fontweight='bold')
         
-        plt.tight_layout()
-        filepath = output_dir / "cost_breakdown.png"
-        plt.savefig(filepath, dpi=dpi, facecolor='white', edgecolor='none')
-        plt.close()
-        generated.append(filepath)
+        fig.tight_layout()
+        save(fig, "cost_breakdown.png", facecolor='white', edgecolor='none')
     
     # 4. Task Results Heatmap (if multiple models and tasks)
-    results = data.get("results", [])
-    if len(results) > 1:
-        # Build matrix
-        tasks = sorted(set(r.get("task", "") for r in results))
-        models_list = sorted(set(r.get("model", "").split('/')[-1][:20] for r in results))
+    if rows is None:
+        rows = result_rows(data)
+    outcomes, models_list, tasks = _task_grid(rows)
+    
+    if len(tasks) > 1 or len(models_list) > 1:
+        # Scatter the outcomes into a -1 (not run) matrix
+        task_index = {task: j for j, task in enumerate(tasks)}
+        model_index = {model: i for i, model in enumerate(models_list)}
+        n = len(outcomes)
+        matrix_np = np.full((len(models_list), len(tasks)), -1, dtype=np.int8)
+        matrix_np[
+            np.fromiter((model_index[model] for model, _ in outcomes), np.intp, n),
+            np.fromiter((task_index[task] for _, task in outcomes), np.intp, n),
+        ] = np.fromiter(outcomes.values(), np.int8, n)
         
-        if len(tasks) > 1 or len(models_list) > 1:
-            matrix = []
-            for model in models_list:
-                row = []
-                for task in tasks:
-                    found = [r for r in results 
-                            if r.get("task") == task and model in r.get("model", "")]
-                    if found:
-                        row.append(1 if found[0].get("success") else 0)
-                    else:
-                        row.append(-1)  # Not run
-                matrix.append(row)
-            
-            fig, ax = plt.subplots(figsize=(max(8, len(tasks)), max(4, len(models_list) * 0.5)))
-            
-            import numpy as np
-            matrix_np = np.array(matrix)
-            
-            cmap = plt.cm.RdYlGn
-            im = ax.imshow(matrix_np, cmap=cmap, vmin=0, vmax=1, aspect='auto')
-            
-            ax.set_xticks(range(len(tasks)))
-            ax.set_xticklabels(tasks, rotation=45, ha='right')
-            ax.set_yticks(range(len(models_list)))
-            ax.set_yticklabels(models_list)
-            
-            ax.set_title('Task Results by Model (Green=Pass, Red=Fail)')
-            
-            plt.tight_layout()
-            filepath = output_dir / "results_heatmap.png"
-            plt.savefig(filepath, dpi=150)
-            plt.close()
-            generated.append(filepath)
+        fig, ax = subplots(figsize=(max(8, len(tasks)), max(4, len(models_list) * 0.5)))
+        
+        cmap = mpl.colormaps['RdYlGn']
+        im = ax.imshow(matrix_np, cmap=cmap, vmin=0, vmax=1, aspect='auto',
+                       interpolation='nearest')
+        
+        ax.set_xticks(range(len(tasks)))
+        ax.set_xticklabels(tasks, rotation=45, ha='right')
+        ax.set_yticks(range(len(models_list)))
+        ax.set_yticklabels(models_list)
+        
+        ax.set_title('Task Results by Model (Green=Pass, Red=Fail)')
+        
+        fig.tight_layout()
+        save(fig, "results_heatmap.png", dpi=150)
     
+    pool.shutdown()
+    for future in saves:
+        future.result()  # Re-raise any save error
     return generated
 
 
+# Inline SVG charts for HTML reports generated without PNGs
+SVG_NOT_RUN = "#333"
+SVG_TEXT = 'fill="#eee" font-family="sans-serif" font-size="12"'
+
+
+def _svg_pass_rate_chart(model_results: list[ModelResult]) -> str:
+    """Horizontal pass-rate bars, one per model."""
+    label_w, bar_w, row_h = 170, 300, 28
+    width, height = label_w + bar_w + 110, 50 + row_h * len(model_results)
+    parts = [
+        f'<svg class="chart" viewBox="0 0 {width} {height}" width="{width}" height="{height}">',
+        f'<text x="{width // 2}" y="24" text-anchor="middle" {SVG_TEXT} font-weight="bold">'
+        'Model Performance Comparison</text>',
+    ]
+    for i, r in enumerate(model_results):
+        y = 40 + i * row_h
+        parts.append(
+            f'<text x="{label_w - 8}" y="{y + 15}" text-anchor="end" {SVG_TEXT}>'
+            f'{escape(r.short_model[:24])}</text>'
+            f'<rect x="{label_w}" y="{y}" width="{bar_w}" height="20" fill="{SVG_NOT_RUN}"/>'
+            f'<rect x="{label_w}" y="{y}" width="{r.pass_rate * bar_w:.1f}" height="20" '
+            f'fill="{tier_color(r.pass_rate)}"/>'
+            f'<text x="{label_w + bar_w + 8}" y="{y + 15}" {SVG_TEXT}>'
+            f'{r.pass_rate * 100:.0f}% ({r.tasks_passed}/{r.tasks_run})</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _svg_cost_scatter(model_results: list[ModelResult]) -> str:
+    """Total cost against pass rate, one labelled point per model."""
+    left, top, plot_w, plot_h = 60, 40, 420, 260
+    width, height = left + plot_w + 120, top + plot_h + 50
+    max_cost = max((r.total_cost for r in model_results), default=0) or 1
+    parts = [
+        f'<svg class="chart" viewBox="0 0 {width} {height}" width="{width}" height="{height}">',
+        f'<text x="{width // 2}" y="24" text-anchor="middle" {SVG_TEXT} font-weight="bold">'
+        'Cost vs Performance</text>',
+        f'<line x1="{left}" y1="{top + plot_h}" x2="{left + plot_w}" y2="{top + plot_h}" stroke="#888"/>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{top + plot_h}" stroke="#888"/>',
+        f'<text x="{left + plot_w // 2}" y="{height - 10}" text-anchor="middle" {SVG_TEXT}>'
+        f'Total Cost ($0 - ${max_cost:.3f})</text>',
+        f'<text x="{left - 8}" y="{top + 4}" text-anchor="end" {SVG_TEXT}>100%</text>',
+        f'<text x="{left - 8}" y="{top + plot_h}" text-anchor="end" {SVG_TEXT}>0%</text>',
+    ]
+    for r in model_results:
+        x = left + r.total_cost / max_cost * plot_w
+        y = top + (1 - r.pass_rate) * plot_h
+        # Label away from the right edge, as in the PNG chart
+        dx, anchor = (9, "start") if x < left + plot_w * 0.7 else (-9, "end")
+        parts.append(
+            f'<circle cx="{x:.1f}" cy="{y:.1f}" r="6" fill="{tier_color(r.pass_rate)}"/>'
+            f'<text x="{x + dx:.1f}" y="{y - 6:.1f}" text-anchor="{anchor}" {SVG_TEXT}>'
+            f'{escape(r.short_model[:24])}</text>'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def _svg_heatmap(rows: list[ResultRow]) -> str:
+    """Pass/fail grid of models by tasks; empty when there is one cell."""
+    outcomes, models_list, tasks = _task_grid(rows)
+    if len(tasks) <= 1 and len(models_list) <= 1:
+        return ""
+    
+    label_w, top, cell = 170, 130, 20
+    # Task labels are rotated up and to the right, past the last column
+    width, height = label_w + cell * len(tasks) + 110, top + cell * len(models_list) + 10
+    fills = {1: CHART_COLORS['success'], 0: CHART_COLORS['failure']}
+    parts = [
+        f'<svg class="chart" viewBox="0 0 {width} {height}" width="{width}" height="{height}">',
+        f'<text x="10" y="20" {SVG_TEXT} font-weight="bold">Task Results by Model</text>',
+    ]
+    for j, task in enumerate(tasks):
+        x = label_w + j * cell + cell // 2
+        parts.append(
+            f'<text x="{x}" y="{top - 6}" transform="rotate(-45 {x} {top - 6})" {SVG_TEXT}>'
+            f'{escape(task[:20])}</text>'
+        )
+    for i, model in enumerate(models_list):
+        y = top + i * cell
+        parts.append(
+            f'<text x="{label_w - 8}" y="{y + 14}" text-anchor="end" {SVG_TEXT}>{escape(model)}</text>'
+        )
+        for j, task in enumerate(tasks):
+            fill = fills.get(outcomes.get((model, task)), SVG_NOT_RUN)
+            parts.append(
+                f'<rect x="{label_w + j * cell}" y="{y}" width="{cell - 2}" height="{cell - 2}" '
+                f'fill="{fill}"/>'
+            )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
 def generate_html_report(data: dict, model_results: list[ModelResult], 
-                         output_dir: Path, charts: list[Path]) -> Path:
+                         output_dir: Path, charts: list[Path],
+                         rows: Optional[list[ResultRow]] = None) -> Path:
     """Generate an HTML report."""
     output_dir.mkdir(parents=True, exist_ok=True)
+    if rows is None:
+        rows = result_rows(data)
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Build results table rows
-    result_rows = ""
-    for r in data.get("results", []):
-        status_class = "success" if r.get("success") else "failure"
-        status_icon = "✓" if r.get("success") else "✗"
-        result_rows += f"""
-        <tr class="{status_class}">
-            <td>{r.get('task', 'unknown')}</td>
-            <td>{r.get('model', 'unknown')}</td>
-            <td>{status_icon}</td>
-            <td>${r.get('cost', 0):.4f}</td>
-            <td>{r.get('time', 0):.1f}s</td>
-        </tr>"""
+    # Build results table rows (joined once; += on a large table is quadratic)
+    table_rows = "".join(
+        _HTML_RESULT_ROW(
+            "success" if r.success else "failure", escape(r.task), escape(r.model),
+            "✓" if r.success else "✗", r.cost, r.time,
+        )
+        for r in rows
+    )
     
     # Build model summary rows
-    model_rows = ""
-    for r in model_results:
-        model_rows += f"""
-        <tr>
-            <td>{r.model}</td>
-            <td>{r.tasks_passed}/{r.tasks_run}</td>
-            <td>{r.pass_rate * 100:.1f}%</td>
-            <td>${r.total_cost:.4f}</td>
-            <td>{r.avg_time:.1f}s</td>
-        </tr>"""
-    
-    # Chart images
-    chart_html = ""
-    for chart in charts:
-        rel_path = chart.name
-        chart_html += f'<img src="{rel_path}" alt="{chart.stem}" class="chart">\n'
+    model_rows = "".join(
+        _HTML_MODEL_ROW(
+            escape(r.model), r.tasks_passed, r.tasks_run, r.pass_rate * 100,
+            r.total_cost, r.avg_time,
+        )
+        for r in model_results
+    )
+    
+    # Chart images; without PNGs the charts are drawn inline as SVG, so the
+    # report stays a single file and needs no matplotlib
+    if charts:
+        chart_html = "".join(
+            f'<img src="{escape(chart.name)}" alt="{escape(chart.stem)}" class="chart">\n'
+            for chart in charts
+        )
+    elif model_results:
+        chart_html = "\n".join(filter(None, [
+            _svg_pass_rate_chart(model_results),
+            _svg_cost_scatter(model_results),
+            _svg_heatmap(rows),
+        ]))
+    else:
+        chart_html = ""
     
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -507,8 +841,10 @@ def generate_html_report(data: dict, model_results: list[ModelResult],
         }}
         .chart {{
             max-width: 100%;
+            height: auto;
             border-radius: 10px;
         }}
+        svg.chart {{ background: #16213e; }}
         .footer {{
             text-align: center;
             color: #666;
@@ -538,7 +874,7 @@ def generate_html_report(data: dict, model_results: list[ModelResult],
             <div class="stat-label">Failed</div>
         </div>
         <div class="stat-card">
-            <div class="stat-value">{data.get('pass_rate', '0%')}</div>
+            <div class="stat-value">{escape(str(data.get('pass_rate', '0%')))}</div>
             <div class="stat-label">Pass Rate</div>
         </div>
         <div class="stat-card">
@@ -572,7 +908,7 @@ def generate_html_report(data: dict, model_results: list[ModelResult],
             <th>Cost</th>
             <th>Time</th>
         </tr>
-        {result_rows}
+        {table_rows}
     </table>
     
     <h2>📈 Charts</h2>
@@ -588,8 +924,7 @@ def generate_html_report(data: dict, model_results: list[ModelResult],
 """
     
     filepath = output_dir / "report.html"
-    with open(filepath, "w") as f:
-        f.write(html)
+    filepath.write_bytes(html.encode("utf-8"))
     
     return filepath
 
@@ -607,7 +942,7 @@ Examples:
         """
     )
     parser.add_argument("--input", "-i", type=str,
-                        help="Input results JSON file (default: latest)")
+                        help="Input suite JSON or results JSONL file (default: latest)")
     parser.add_argument("--html", action="store_true",
                         help="Generate HTML report")
     parser.add_argument("--png", action="store_true",
@@ -636,12 +971,16 @@ Examples:
     
     print(f"📂 Loading: {input_path}")
     data = load_results(input_path)
-    model_results = aggregate_by_model(data)
+    # Every report works from these rows, so a streamed file is parsed once
+    rows = result_rows(data)
+    if "total_tasks" not in data:
+        data.update(summarize_rows(rows))
+    model_results = aggregate_by_model(rows)
     
     output_dir = script_dir / args.output
     
     # Always print terminal report
-    print_terminal_report(data, model_results)
+    print_terminal_report(data, model_results, rows)
     
     # Generate charts if requested
     charts = []
@@ -650,7 +989,7 @@ Examples:
         print(f"\n📊 Generating PNG charts ({quality} quality)...")
         charts = generate_png_charts(
             data, model_results, output_dir,
-            publication_quality=args.publication
+            publication_quality=args.publication, rows=rows
         )
         for chart in charts:
             print(f"   ✓ {chart}")
@@ -658,7 +997,7 @@ Examples:
     # Generate HTML if requested
     if args.html or args.all:
         print(f"\n📄 Generating HTML report...")
-        html_path = generate_html_report(data, model_results, output_dir, charts)
+        html_path = generate_html_report(data, model_results, output_dir, charts, rows)
         print(f"   ✓ {html_path}")
         print(f"\n   Open in browser: file://{html_path.absolute()}")
     
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Exact-match response cache for driver LLM calls.
+
+A repeated benchmark run of the same task sends the driver the same
+system prompt and conversation; with the cache enabled those calls are
+answered from disk instead of the provider, at no token cost.
+
+Entries are JSON files named by the SHA-256 of (model, system prompt,
+messages) under results/.llm_cache/:
+
+    {"reply": "...", "input_tokens": 1234, "output_tokens": 321}
+
+SemanticCache goes further for driver reviews: a review whose payload
+embeds close enough to an earlier one (a Coder looping on the same error)
+reuses that review's reply. It needs numpy and sentence-transformers.
+
+Only enable these when a cached reply is an acceptable stand-in for a fresh
+one (harness development, CI); they make driver runs deterministic.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    HAS_SENTENCE_TRANSFORMERS = True
+except ImportError:
+    HAS_SENTENCE_TRANSFORMERS = False
+
+
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = 0.92
+SEMANTIC_MAX_ENTRIES = 1024
+
+
+def cache_key(model: str, system: str, messages: list) -> str:
+    """Key for one LLM request; any change to the inputs is a miss."""
+    payload = json.dumps(
+        {"model": model, "system": system, "msgs": messages},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """Directory of cached LLM responses, one JSON file per key."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        # Fan out by prefix so the directory stays small
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        """Cached entry for key, or None on a miss or unreadable entry."""
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) and "reply" in entry else None
+
+    def set(self, key: str, entry: dict):
+        """Store entry for key; failures to write are ignored."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+
+class SemanticCache:
+    """Nearest-neighbour cache of driver replies, persisted as .npz.
+
+    Embeddings are stored normalized, so cosine similarity is one
+    matrix-vector product. Rows are kept in least-recently-used order and
+    the oldest are dropped beyond `max_entries`.
+
+    An instance may be shared by concurrent runs; each file should have
+    only one instance per process, or the instances overwrite each
+    other's entries.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        encoder: "SentenceTransformer",
+        threshold: float = SEMANTIC_THRESHOLD,
+        max_entries: int = SEMANTIC_MAX_ENTRIES,
+    ):
+        self.path = Path(path)
+        self.encoder = encoder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.embeddings = None  # (n, dim) float32, unit rows
+        self.replies: list[str] = []
+        self._lock = threading.Lock()
+        try:
+            with np.load(self.path) as data:
+                self.embeddings = data["embeddings"]
+                self.replies = [str(r) for r in data["replies"]]
+        except FileNotFoundError:
+            pass
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Warning: ignoring unreadable semantic cache {self.path}: {e}", file=sys.stderr)
+
+    @staticmethod
+    def load_encoder() -> "SentenceTransformer":
+        """Load the embedding model; do this once and share it."""
+        if not (HAS_NUMPY and HAS_SENTENCE_TRANSFORMERS):
+            raise ImportError("numpy and sentence-transformers are required for the semantic cache")
+        return SentenceTransformer(EMBEDDING_MODEL)
+
+    def embed(self, text: str) -> "np.ndarray":
+        return self.encoder.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def get(self, query: "np.ndarray") -> Optional[str]:
+        """Reply of the most similar entry if it clears the threshold."""
+        with self._lock:
+            if not self.replies:
+                return None
+            sims = self.embeddings @ query
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            # Move the hit to the most-recently-used end
+            reply = self.replies.pop(best)
+            row = self.embeddings[best]
+            self.embeddings = np.vstack([np.delete(self.embeddings, best, axis=0), row])
+            self.replies.append(reply)
+            return reply
+
+    def set(self, query: "np.ndarray", reply: str):
+        """Add an entry, evict the least recently used, and persist."""
+        row = query[np.newaxis, :]
+        with self._lock:
+            if self.embeddings is None:
+                self.embeddings = row
+            else:
+                self.embeddings = np.vstack([self.embeddings, row])
+            self.replies.append(reply)
+            if len(self.replies) > self.max_entries:
+                drop = len(self.replies) - self.max_entries
+                self.embeddings = self.embeddings[drop:]
+                self.replies = self.replies[drop:]
+            self._save()
+
+    def _save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # np.savez appends .npz to names that lack it
+            tmp = self.path.with_name(
+                f"{self.path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+            )
+            np.savez(tmp, embeddings=self.embeddings, replies=np.array(self.replies))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
@@ -7,10 +7,19 @@ Prices are in USD per 1M tokens (as of January 2026).
 Note: Prices change frequently. Update as needed.
 """
 
-from dataclasses import dataclass
+import functools
+import re
+from dataclasses import dataclass, field
 from typing import Optional
 
 
+# Prompt-cache pricing relative to the input rate (Anthropic): writing a
+# cache entry costs 1.25x, reading it back 0.1x
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+# Batch API requests (OpenAI Batch, Anthropic Message Batches) are half price
+BATCH_MULTIPLIER = 0.5
+
 # Pricing per 1M tokens (input, output)
 # Source: Provider pricing pages as of Jan 2026
 MODEL_PRICING = {
@@ -67,8 +76,39 @@ MODEL_PRICING = {
     "qwen/qwen-2.5-72b-instruct": (0.35, 0.40),
 }
 
+# Unknown model - use conservative estimate
+DEFAULT_PRICING = (5.0, 15.0)
+PROVIDER_PREFIXES = ("openai/", "anthropic/", "google/", "xai/")
+_PROVIDER_PREFIX_RE = re.compile("|".join(re.escape(p) for p in PROVIDER_PREFIXES))
+
+# Exact-name lookup table: every priced model, bare and with each provider
+# prefix, resolved once at import instead of normalized per tracker
+_PRICE_CACHE = dict(MODEL_PRICING)
+_PRICE_CACHE.update(
+    (prefix + model, prices)
+    for prefix in PROVIDER_PREFIXES
+    for model, prices in MODEL_PRICING.items()
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_model_name(model: str) -> str:
+    """Normalize model name for pricing lookup."""
+    # Remove provider prefixes in one pass
+    return _PROVIDER_PREFIX_RE.sub("", model)
 
-@dataclass
+
+def model_pricing(model: str) -> tuple[float, float]:
+    """(input, output) USD per 1M tokens for a model name, prefixed or not."""
+    prices = _PRICE_CACHE.get(model)
+    if prices is None:
+        # Unusual spelling: normalize once and remember the answer
+        prices = MODEL_PRICING.get(_normalize_model_name(model), DEFAULT_PRICING)
+        _PRICE_CACHE[model] = prices
+    return prices
+
+
+@dataclass(slots=True)
 class TokenUsage:
     """Track token usage for a single call."""
     input_tokens: int = 0
@@ -79,7 +119,7 @@ class TokenUsage:
         return self.input_tokens + self.output_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class CostTracker:
     """Track cumulative costs across multiple API calls."""
     model: str
@@ -87,34 +127,44 @@ class CostTracker:
     output_tokens: int = 0
     total_cost_usd: float = 0.0
     call_count: int = 0
+    cache_write_tokens: int = 0  # Included in input_tokens
+    cache_read_tokens: int = 0   # Included in input_tokens
+    input_price_per_m: float = field(init=False, repr=False)
+    output_price_per_m: float = field(init=False, repr=False)
     
     def __post_init__(self):
-        # Normalize model name
-        self.model_key = self._normalize_model_name(self.model)
-        if self.model_key in MODEL_PRICING:
-            self.input_price_per_m, self.output_price_per_m = MODEL_PRICING[self.model_key]
-        else:
-            # Unknown model - use conservative estimate
-            self.input_price_per_m = 5.0
-            self.output_price_per_m = 15.0
-    
-    def _normalize_model_name(self, model: str) -> str:
-        """Normalize model name for pricing lookup."""
-        # Remove provider prefix
-        model = model.replace("openai/", "").replace("anthropic/", "")
-        model = model.replace("google/", "").replace("xai/", "")
-        return model
-    
-    def add_usage(self, input_tokens: int, output_tokens: int):
-        """Add token usage and calculate cost."""
-        self.input_tokens += input_tokens
+        self.input_price_per_m, self.output_price_per_m = model_pricing(self.model)
+    
+    def add_usage(
+        self,
+        input_tokens: int,
+        output_tokens: int,
+        cache_write_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        batch: bool = False,
+    ):
+        """Add token usage and calculate cost.
+        
+        input_tokens are uncached input; prompt-cache writes and reads are
+        passed separately and billed with the cache multipliers. batch=True
+        applies the Batch API discount.
+        """
+        self.input_tokens += input_tokens + cache_write_tokens + cache_read_tokens
         self.output_tokens += output_tokens
+        self.cache_write_tokens += cache_write_tokens
+        self.cache_read_tokens += cache_read_tokens
         self.call_count += 1
         
         # Calculate cost
-        input_cost = (input_tokens / 1_000_000) * self.input_price_per_m
-        output_cost = (output_tokens / 1_000_000) * self.output_price_per_m
-        self.total_cost_usd += input_cost + output_cost
+        billed_input = (
+            input_tokens
+            + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+            + cache_read_tokens * CACHE_READ_MULTIPLIER
+        )
+        cost = (
+            billed_input * self.input_price_per_m + output_tokens * self.output_price_per_m
+        ) / 1_000_000
+        self.total_cost_usd += cost * BATCH_MULTIPLIER if batch else cost
     
     def add_total_tokens(self, total_tokens: int, input_ratio: float = 0.7):
         """Add tokens when only total is known (estimate split)."""
@@ -132,12 +182,14 @@ class CostTracker:
             "input_tokens": self.input_tokens,
             "output_tokens": self.output_tokens,
             "total_tokens": self.total_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
             "cost_usd": round(self.total_cost_usd, 4),
             "call_count": self.call_count,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkCostSummary:
     """Aggregate costs for a benchmark run."""
     driver_cost: CostTracker
@@ -162,9 +214,8 @@ class BenchmarkCostSummary:
 
 def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> float:
     """Estimate cost for a single call."""
-    tracker = CostTracker(model)
-    tracker.add_usage(input_tokens, output_tokens)
-    return tracker.total_cost_usd
+    input_price, output_price = model_pricing(model)
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
 
 
 def format_cost(cost_usd: float) -> str:
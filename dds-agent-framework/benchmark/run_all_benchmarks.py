@@ -36,8 +36,22 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@dataclass
+
+def read_json(path: Path):
+    """Parse a JSON file, with orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, "rb") as f:
+        return json.load(f)
+
+
+@dataclass(slots=True)
 class TaskResult:
     """Result from running a single task."""
     task_id: str
@@ -53,7 +67,7 @@ class TaskResult:
     samples_expected: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkSuite:
     """Complete benchmark suite results."""
     start_time: str
@@ -257,21 +271,20 @@ def run_single_task(
             )
             
             if matching:
-                with open(matching[0]) as f:
-                    data = json.load(f)
-                    return TaskResult(
-                        task_id=data.get("task_id", full_task_id),
-                        driver_model=data.get("driver_model", driver_model),
-                        coder_model=data.get("coder_model", coder_model),
-                        success=data.get("success", False),
-                        reason=data.get("reason", "Unknown"),
-                        iterations=data.get("total_iterations", 0),
-                        tokens=data.get("total_tokens", 0),
-                        cost_usd=data.get("total_cost_usd", 0.0),
-                        time_seconds=data.get("time_seconds", 0.0),
-                        samples_matched=data.get("samples_matched", 0),
-                        samples_expected=data.get("samples_expected", 0),
-                    )
+                data = read_json(matching[0])
+                return TaskResult(
+                    task_id=data.get("task_id", full_task_id),
+                    driver_model=data.get("driver_model", driver_model),
+                    coder_model=data.get("coder_model", coder_model),
+                    success=data.get("success", False),
+                    reason=data.get("reason", "Unknown"),
+                    iterations=data.get("total_iterations", 0),
+                    tokens=data.get("total_tokens", 0),
+                    cost_usd=data.get("total_cost_usd", 0.0),
+                    time_seconds=data.get("time_seconds", 0.0),
+                    samples_matched=data.get("samples_matched", 0),
+                    samples_expected=data.get("samples_expected", 0),
+                )
         
         # Fallback: parse from output
         success = "PASSED" in output and "FAILED" not in output.split("PASSED")[-1]
@@ -488,8 +501,7 @@ def load_previous_results(filepath: Path) -> Optional[dict]:
     if not filepath.exists():
         return None
     try:
-        with open(filepath) as f:
-            return json.load(f)
+        return read_json(filepath)
     except Exception as e:
         print(f"Warning: Could not load {filepath}: {e}")
         return None
@@ -8,11 +8,22 @@ Uses:
 - Async WaitSet pattern (not polling)
 - External QoS (not hardcoded)
 - Fixed domain ID for reproducibility
+
+With --daemon the subscriber stays up and serves verification sessions over a
+UNIX control socket, so a benchmark sweep pays interpreter start-up and DDS
+initialization once instead of per run. Each request is one JSON line:
+
+    {"domain": 85, "count": 10, "timeout": 20, "domain_tag": "...", "shmem": false}
+
+The daemon answers {"ready": true} once the session's reader exists, then a
+final line with the received samples and the usual result fields.
 """
 
 import argparse
 import json
+import os
 import sys
+import threading
 import time
 
 
@@ -27,25 +38,42 @@ def create_hello_world_type():
     return hello_type
 
 
-def run_subscriber(
-    domain_id: int,
+def create_participant(domain_id: int, domain_tag: str = None, shmem: bool = False):
+    """Create a participant, optionally confined to a domain tag / SHMEM.
+    
+    One-shot runs get both through NDDS_QOS_PROFILES; the daemon serves many
+    runs from one process, so it sets them per participant instead.
+    """
+    import rti.connextdds as dds
+    
+    if domain_tag is None and not shmem:
+        return dds.DomainParticipant(domain_id)
+    
+    qos = dds.DomainParticipant.default_participant_qos
+    if domain_tag is not None:
+        qos.property["dds.domain_participant.domain_tag"] = domain_tag
+    if shmem:
+        qos.transport_builtin.mask = dds.TransportBuiltinMask.SHMEM
+        qos.discovery.initial_peers = ["shmem://"]
+    return dds.DomainParticipant(domain_id, qos)
+
+
+def receive_samples(
+    participant,
+    topic,
     expected_count: int,
     timeout: float,
-    output_file,
+    emit,
+    on_ready=None,
 ) -> dict:
-    """Run reference subscriber with async WaitSet.
+    """Read samples with an async WaitSet, passing each one to emit().
+    
+    on_ready() is called once the reader exists.
     
     Returns dict with counts and status.
     """
     import rti.connextdds as dds
     
-    # Create participant
-    participant = dds.DomainParticipant(domain_id)
-    
-    # Create type and topic
-    hello_type = create_hello_world_type()
-    topic = dds.DynamicData.Topic(participant, "HelloWorld", hello_type)
-    
     # Create subscriber and reader
     subscriber = dds.Subscriber(participant)
     reader = dds.DynamicData.DataReader(subscriber, topic)
@@ -56,7 +84,9 @@ def run_subscriber(
     condition.enabled_statuses = dds.StatusMask.DATA_AVAILABLE
     waitset.attach_condition(condition)
     
-    print(f"Reference subscriber started on domain {domain_id}", file=sys.stderr)
+    print(f"Reference subscriber started on domain {participant.domain_id}", file=sys.stderr)
+    if on_ready is not None:
+        on_ready()
     print(f"Waiting for {expected_count} samples (timeout: {timeout}s)...", file=sys.stderr)
     
     samples_received = []
@@ -84,10 +114,7 @@ def run_subscriber(
                             }
                         }
                         samples_received.append(sample_dict)
-                        
-                        # Write to output immediately
-                        output_file.write(json.dumps(sample_dict) + "\n")
-                        output_file.flush()
+                        emit(sample_dict)
                         
                         print(f"  Received [{len(samples_received)}]: count={sample.data['count']}", file=sys.stderr)
                         
@@ -100,6 +127,11 @@ def run_subscriber(
     elapsed = time.time() - start_time
     print(f"Received {len(samples_received)}/{expected_count} samples in {elapsed:.1f}s", file=sys.stderr)
     
+    # The daemon reuses the participant; drop this session's endpoints
+    waitset.detach_condition(condition)
+    reader.close()
+    subscriber.close()
+    
     return {
         "samples_received": len(samples_received),
         "expected": expected_count,
@@ -108,6 +140,108 @@ def run_subscriber(
     }
 
 
+def run_subscriber(
+    domain_id: int,
+    expected_count: int,
+    timeout: float,
+    output_file,
+    ready: bool = False,
+) -> dict:
+    """Run reference subscriber with async WaitSet.
+    
+    Returns dict with counts and status.
+    """
+    import rti.connextdds as dds
+    
+    # Create participant
+    participant = dds.DomainParticipant(domain_id)
+    
+    # Create type and topic
+    hello_type = create_hello_world_type()
+    topic = dds.DynamicData.Topic(participant, "HelloWorld", hello_type)
+    
+    def emit(sample_dict):
+        # Write to output immediately
+        output_file.write(json.dumps(sample_dict) + "\n")
+        output_file.flush()
+    
+    def announce_ready():
+        # Readiness sentinel for the benchmark runner; samples follow it
+        # when they go to stdout
+        print("READY", flush=True)
+    
+    return receive_samples(
+        participant, topic, expected_count, timeout, emit,
+        on_ready=announce_ready if ready else None,
+    )
+
+
+def serve(control_path: str):
+    """Serve verification sessions on a UNIX socket until killed."""
+    import socketserver
+    import rti.connextdds as dds
+    
+    # Participants and topics are kept per (domain, tag, shmem); every
+    # session gets its own reader
+    endpoints = {}
+    endpoints_lock = threading.Lock()
+    
+    class SessionHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                key = (
+                    request["domain"],
+                    request.get("domain_tag"),
+                    request.get("shmem", False),
+                )
+                with endpoints_lock:
+                    if key not in endpoints:
+                        participant = create_participant(*key)
+                        topic = dds.DynamicData.Topic(
+                            participant, "HelloWorld", create_hello_world_type()
+                        )
+                        endpoints[key] = (participant, topic)
+                participant, topic = endpoints[key]
+                
+                samples = []
+                
+                def announce_ready():
+                    self.wfile.write(b'{"ready": true}\n')
+                    self.wfile.flush()
+                
+                result = receive_samples(
+                    participant, topic,
+                    request["count"], request.get("timeout", 30.0),
+                    samples.append, on_ready=announce_ready,
+                )
+                result["samples"] = samples
+                self.wfile.write((json.dumps(result) + "\n").encode())
+                self.wfile.flush()
+    
+    if os.path.exists(control_path):
+        os.unlink(control_path)
+    
+    with socketserver.ThreadingUnixStreamServer(control_path, SessionHandler) as server:
+        server.daemon_threads = True
+        
+        def watch_parent():
+            # The runner holds our stdin open; EOF means it has gone away
+            for _ in sys.stdin:
+                pass
+            server.shutdown()
+        
+        threading.Thread(target=watch_parent, daemon=True).start()
+        print(f"Reference subscriber daemon listening on {control_path}", file=sys.stderr)
+        print("READY", flush=True)
+        try:
+            server.serve_forever()
+        finally:
+            os.unlink(control_path)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Reference HelloWorld Subscriber")
     parser.add_argument("--domain", "-d", type=int, default=85,
@@ -118,6 +252,12 @@ def main():
                         help="Timeout in seconds (default: 30)")
     parser.add_argument("--output", "-o", type=str, default=None,
                         help="Output file for JSONL (default: stdout)")
+    parser.add_argument("--ready", action="store_true",
+                        help="Print READY on stdout once the reader exists")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Serve verification sessions on --control instead of running once")
+    parser.add_argument("--control", type=str, default=None,
+                        help="UNIX socket path for --daemon")
     
     args = parser.parse_args()
     
@@ -127,10 +267,21 @@ def main():
         print("ERROR: RTI Connext DDS Python API not available", file=sys.stderr)
         sys.exit(1)
     
+    if args.daemon:
+        if not args.control:
+            parser.error("--daemon requires --control")
+        try:
+            serve(args.control)
+        except KeyboardInterrupt:
+            pass
+        return
+    
     output_file = open(args.output, "w") if args.output else sys.stdout
     
     try:
-        result = run_subscriber(args.domain, args.count, args.timeout, output_file)
+        result = run_subscriber(
+            args.domain, args.count, args.timeout, output_file, ready=args.ready
+        )
         sys.exit(0 if result["success"] else 1)
     finally:
         if args.output:
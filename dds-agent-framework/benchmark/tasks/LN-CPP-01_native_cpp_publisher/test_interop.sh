@@ -23,11 +23,22 @@ TEMP_OUTPUT=$(mktemp)
 python3 "${SCRIPT_DIR}/reference/subscriber.py" \
     --count ${EXPECTED_SAMPLES} \
     --timeout ${TIMEOUT} \
+    --ready \
     > "${TEMP_OUTPUT}" 2>/dev/null &
 SUB_PID=$!
 
-# Give subscriber time to start
-sleep 2
+# Wait for the subscriber to print READY (its reader exists), up to 10s
+for _ in $(seq 1 100); do
+    grep -qx READY "${TEMP_OUTPUT}" && break
+    kill -0 ${SUB_PID} 2>/dev/null || break
+    sleep 0.1
+done
+if ! grep -qx READY "${TEMP_OUTPUT}"; then
+    echo "❌ FAIL: subscriber did not become ready"
+    kill ${SUB_PID} 2>/dev/null || true
+    rm -f "${TEMP_OUTPUT}"
+    exit 1
+fi
 
 echo "[2] Running C++ publisher..."
 timeout 30 "${BUILD_DIR}/publisher" --count ${EXPECTED_SAMPLES} 2>&1 | head -20
@@ -37,7 +48,7 @@ echo "[3] Waiting for subscriber..."
 wait ${SUB_PID} || true
 
 # Check results
-RECEIVED=$(wc -l < "${TEMP_OUTPUT}" | tr -d ' ')
+RECEIVED=$(grep -cvx READY "${TEMP_OUTPUT}" || true)
 echo "[4] Checking results..."
 echo "    Received: ${RECEIVED}/${EXPECTED_SAMPLES} samples"
 
@@ -28,6 +28,8 @@ def main():
     parser.add_argument("--count", "-c", type=int, default=10)
     parser.add_argument("--timeout", "-t", type=float, default=30.0)
     parser.add_argument("--domain", "-d", type=int, default=0)
+    parser.add_argument("--ready", action="store_true",
+                        help="Print READY on stdout once the reader exists")
     args = parser.parse_args()
     
     signal.signal(signal.SIGTERM, signal_handler)
@@ -49,6 +51,9 @@ def main():
     reader_qos.history.kind = dds.HistoryKind.KEEP_ALL
     
     reader = dds.DynamicData.DataReader(subscriber, topic, reader_qos)
+    if args.ready:
+        # Lets the caller start the publisher now instead of sleeping
+        print("READY", flush=True)
     
     # WaitSet pattern
     waitset = dds.WaitSet()
@@ -10,7 +10,7 @@ Handles the full workflow:
 import os
 import subprocess
 import sys
-import time
+import threading
 from pathlib import Path
 
 TIMEOUT = 120
@@ -137,6 +137,7 @@ signal.signal(signal.SIGINT, handler)
 parser = argparse.ArgumentParser()
 parser.add_argument("--count", type=int, default=10)
 parser.add_argument("--timeout", type=float, default=30)
+parser.add_argument("--ready", action="store_true")
 args = parser.parse_args()
 
 t = dds.StructType("HelloWorld")
@@ -150,6 +151,8 @@ qos = dds.DataReaderQos()
 qos.reliability.kind = dds.ReliabilityKind.RELIABLE
 qos.durability.kind = dds.DurabilityKind.TRANSIENT_LOCAL
 reader = dds.DynamicData.DataReader(dds.Subscriber(p), topic, qos)
+if args.ready:
+    print("READY", flush=True)
 
 ws = dds.WaitSet()
 cond = dds.ReadCondition(reader, dds.DataState.any_data)
@@ -165,19 +168,34 @@ while running and received < args.count and (time.time() - start) < args.timeout
                 print(json.dumps({"message": s.data["message"], "count": s.data["count"]}), flush=True)
                 received += 1
 '''
-        result = subprocess.Popen(
-            [sys.executable, "-c", sub_code, "--count", "10", "--timeout", "30"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
+        sub_cmd = [sys.executable, "-c", sub_code]
     else:
-        result = subprocess.Popen(
-            [sys.executable, str(ref_subscriber), "--count", "10", "--timeout", "30"],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-        )
+        sub_cmd = [sys.executable, str(ref_subscriber)]
     
-    sub_proc = result
+    sub_proc = subprocess.Popen(
+        sub_cmd + ["--count", "10", "--timeout", "30", "--ready"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    
+    # The subscriber prints READY once its reader exists, then one line per
+    # sample; a thread collects them so the wait for READY can time out
+    ready = threading.Event()
+    lines = []
+    
+    def read_subscriber():
+        for line in sub_proc.stdout:
+            if line.strip() == "READY":
+                ready.set()
+            elif line.strip():
+                lines.append(line)
     
-    time.sleep(2)
+    reader = threading.Thread(target=read_subscriber, daemon=True)
+    reader.start()
+    
+    if not ready.wait(timeout=10):
+        sub_proc.kill()
+        print("✗ Subscriber did not become ready")
+        return False
     
     # Run C++ publisher
     pub_proc = subprocess.Popen(
@@ -187,15 +205,15 @@ while running and received < args.count and (time.time() - start) < args.timeout
     
     try:
         pub_stdout, pub_stderr = pub_proc.communicate(timeout=30)
-        sub_stdout, sub_stderr = sub_proc.communicate(timeout=30)
+        sub_proc.wait(timeout=30)
     except subprocess.TimeoutExpired:
         pub_proc.kill()
         sub_proc.kill()
         print("✗ Timeout during interop test")
         return False
+    reader.join()
     
     # Count received samples
-    lines = [l for l in sub_stdout.strip().split("\n") if l.strip()]
     received = len(lines)
     
     print(f"Received {received}/10 samples")
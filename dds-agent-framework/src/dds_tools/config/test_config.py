@@ -6,6 +6,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 @dataclass
 class PublisherConfig:
@@ -70,7 +75,7 @@ def load_test_config(config_path: str | Path) -> TestConfig:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f.read(), Loader=SafeLoader)
 
     if not isinstance(data, dict):
         raise ValueError("Config must be a YAML dictionary")
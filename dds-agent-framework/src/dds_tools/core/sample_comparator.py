@@ -4,7 +4,6 @@ This module compares DDS samples captured in JSONL format against expected
 output, with configurable float tolerance for numerical comparisons.
 """
 
-import hashlib
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -180,6 +179,11 @@ class SampleComparator:
 
         # Compare each sample
         for i in range(min(len(actual), len(expected))):
+            # Identical samples can't mismatch under any tolerance or ignore
+            # list, and dict equality runs in C; only walk the ones that differ
+            if actual[i] == expected[i]:
+                matched_count += 1
+                continue
             field_mismatches = self._compare_dicts(actual[i], expected[i], "")
             if field_mismatches:
                 mismatches.append(
@@ -394,10 +398,13 @@ class SampleComparator:
         return mismatches
 
     def _hash_sample(self, sample: dict) -> str:
-        """Create a content hash for a sample, ignoring ignored fields."""
+        """Create a canonical key for a sample, ignoring ignored fields.
+
+        The canonical JSON string itself is the key; the dicts it is stored
+        in hash it, so a separate digest would only add work.
+        """
         filtered = self._filter_ignored(sample, "")
-        canonical = json.dumps(filtered, sort_keys=True)
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return json.dumps(filtered, sort_keys=True, separators=(",", ":"))
 
     def _filter_ignored(self, obj: Any, path: str) -> Any:
         """Recursively filter out ignored fields."""
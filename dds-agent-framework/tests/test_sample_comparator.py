@@ -190,6 +190,31 @@ class TestSampleComparator:
         result = comparator.compare_samples(actual, expected)
         assert result.passed
 
+    def test_mixed_identical_and_differing_samples(self) -> None:
+        """Test matched count when only some samples are identical."""
+        actual = [{"topic": "Test", "data": {"value": i}} for i in range(5)]
+        expected = [{"topic": "Test", "data": {"value": i}} for i in range(5)]
+        actual[2] = {"topic": "Test", "data": {"value": 99}}
+
+        comparator = SampleComparator()
+        result = comparator.compare_samples(actual, expected)
+
+        assert not result.passed
+        assert result.matched_count == 4
+        assert [m.index for m in result.mismatches] == [2]
+        assert result.mismatches[0].field_mismatches[0].path == "data.value"
+
+    def test_order_independent_with_tolerance(self) -> None:
+        """Test order-independent matching of floats within tolerance."""
+        actual = [{"v": 2.0}, {"v": 1.0000001}]
+        expected = [{"v": 1.0}, {"v": 2.0}]
+
+        comparator = SampleComparator(float_tolerance=1e-3, order_independent=True)
+        result = comparator.compare_samples(actual, expected)
+
+        assert result.passed
+        assert result.matched_count == 2
+
     def test_compare_files(self, tmp_path: Path) -> None:
         """Test comparing JSONL files."""
         actual_file = tmp_path / "actual.jsonl"